@@ -1,59 +1,157 @@
 #!/usr/bin/env python3
 
+import json
 import os
-from jira import JIRA
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from field_cache import load_field_catalog
 
 # Load configuration
 JIRA_URL = os.getenv('JIRA_URL', 'https://your-jira-instance.atlassian.net')
 JIRA_EMAIL = os.getenv('JIRA_EMAIL')
 JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
 
-def check_for_reference(issue_key, search_term):
-    """Check if an issue has any reference to a search term"""
-    jira = JIRA(server=JIRA_URL, basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN), 
-           options={'rest_api_version': '3', 'verify': False})
+# Fields requested when scanning an issue. Custom fields can carry references,
+# so keep everything except bulky metadata that is not useful for link detection
+SCAN_FIELDS = '*all,-attachment,-worklog,-watches,-votes'
+
+# Shared client so repeated checks reuse one pooled keep-alive connection
+_JIRA_CLIENT = None
+_JIRA_CLIENT_LOCK = threading.Lock()
+
+# Field ID -> display name, fetched once per process
+_FIELD_NAMES = None
+_FIELD_NAMES_LOCK = threading.Lock()
+
+def get_client():
+    """Get the shared JIRA client, creating it on first use"""
+    global _JIRA_CLIENT
+    with _JIRA_CLIENT_LOCK:
+        if _JIRA_CLIENT is None:
+            import urllib3
+            from jira import JIRA
+            from requests.adapters import HTTPAdapter
+            
+            # Suppress SSL warnings for self-signed certificates (verify is disabled below)
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            
+            client = JIRA(server=JIRA_URL, basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN), 
+                          options={'rest_api_version': '3', 'verify': False})
+            # Size the client's session pool so connections are kept alive and reused
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            client._session.mount('https://', adapter)
+            client._session.mount('http://', adapter)
+            _JIRA_CLIENT = client
+        return _JIRA_CLIENT
+
+def _get_field_names(jira):
+    """Get the field ID to name mapping, fetching the catalog only once"""
+    global _FIELD_NAMES
+    with _FIELD_NAMES_LOCK:
+        if _FIELD_NAMES is None:
+            _FIELD_NAMES = {f['id']: f['name'] for f in load_field_catalog(jira, JIRA_URL)}
+        return _FIELD_NAMES
+
+def check_for_reference(issue_key, search_term, any_match_only=False, output=print):
+    """Check if an issue has any reference to a search term
+    
+    With any_match_only, stop at the first matching field instead of
+    collecting and listing every reference. Report lines go to output.
+    """
+    jira = get_client()
     
     try:
-        issue = jira.issue(issue_key, expand='names')
-        print(f"\nChecking {issue_key} for references to '{search_term}'...")
-        print(f"Issue: {issue.key} - {issue.fields.summary}")
-        print("=" * 60)
+        issue = jira.issue(issue_key, fields=SCAN_FIELDS)
+        raw_fields = issue.raw.get('fields', {})
+        output(f"\nChecking {issue_key} for references to '{search_term}'...")
+        output(f"Issue: {issue.key} - {raw_fields.get('summary', '')}")
+        output("=" * 60)
         
         # Get all field names
-        field_names = {f['id']: f['name'] for f in jira.fields()}
+        field_names = _get_field_names(jira)
         
         references_found = []
         
-        # Check all fields
-        for field_id in dir(issue.fields):
-            if field_id.startswith('_'):
-                continue
-                
-            try:
-                value = getattr(issue.fields, field_id, None)
-                if value and str(value) and search_term.upper() in str(value).upper():
-                    field_name = field_names.get(field_id, field_id)
-                    references_found.append((field_name, str(value)))
-            except:
+        # Check all fields in the raw JSON payload
+        pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+        search = pattern.search
+        get_name = field_names.get
+        append = references_found.append
+        for field_id, value in raw_fields.items():
+            if not value:
                 continue
+            
+            text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+            if search(text):
+                if any_match_only:
+                    output(f"\n✅ Found a reference to '{search_term}'")
+                    return True
+                append((get_name(field_id, field_id), text))
         
         if references_found:
-            print(f"\n✅ Found {len(references_found)} reference(s) to '{search_term}':")
+            output(f"\n✅ Found {len(references_found)} reference(s) to '{search_term}':")
             for field_name, value in references_found:
-                print(f"  • {field_name}: {value}")
+                output(f"  • {field_name}: {value}")
         else:
-            print(f"\n❌ No references to '{search_term}' found in {issue_key}")
+            output(f"\n❌ No references to '{search_term}' found in {issue_key}")
             
         return len(references_found) > 0
         
     except Exception as e:
-        print(f"❌ Error checking {issue_key}: {str(e)}")
+        output(f"❌ Error checking {issue_key}: {str(e)}")
         return False
 
+def check_many(issue_keys, search_term, output=print):
+    """Check several issues for a search term with a single JQL search
+    
+    The match runs server-side via JQL 'text ~', which covers text fields
+    (summary, description, comments, text custom fields) but not every
+    field type; use check_for_reference when per-field evidence is needed.
+    Error lines go to output.
+    
+    Returns:
+        set of issue keys that reference the search term
+    """
+    if not issue_keys:
+        return set()
+    
+    jira = get_client()
+    term = search_term.replace('\\', '\\\\').replace('"', '\\"')
+    jql = f'key in ({",".join(issue_keys)}) AND text ~ "\\"{term}\\""'
+    
+    try:
+        issues = jira.search_issues(jql, fields='summary', maxResults=False)
+        return {issue.key for issue in issues}
+    except Exception as e:
+        output(f"❌ Error checking {', '.join(issue_keys)}: {str(e)}")
+        return set()
+
+def check_many_parallel(pairs, max_workers=8, output=print):
+    """Run check_for_reference for (issue_key, search_term) pairs concurrently
+    
+    All workers share the pooled client from get_client(). Each check's
+    report is collected and sent to output whole, in the same order as pairs.
+    
+    Returns:
+        list of booleans in the same order as pairs
+    """
+    def check(pair):
+        lines = []
+        return check_for_reference(*pair, output=lines.append), lines
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for found, lines in executor.map(check, pairs):
+            output("\n".join(lines))
+            results.append(found)
+    return results
+
 if __name__ == "__main__":
     try:
         # Check if IDEA-689 has any reference to AV-99599
-        has_reference = check_for_reference("IDEA-689", "AV-99599")
+        has_reference = check_for_reference("IDEA-689", "AV-99599", any_match_only=True)
         
         if has_reference:
             print(f"\n🔗 IDEA-689 has a link back to AV-99599!")
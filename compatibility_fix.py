@@ -5,21 +5,21 @@ Compatibility fix for Python 3.13 where imghdr module was removed.
 This provides a minimal implementation to satisfy the JIRA library.
 """
 
+import importlib.util
 import sys
+import types
 
 # Check if imghdr module is missing (Python 3.13+)
-if 'imghdr' not in sys.modules:
+if importlib.util.find_spec('imghdr') is None:
     # Create a minimal imghdr module
-    class ImghdrModule:
-        """Minimal imghdr module replacement"""
-        
-        def what(self, file, h=None):
-            """Return the type of image contained in a file or byte stream."""
-            # Return None for all cases since we don't need actual image detection
-            return None
-    
-    # Create the module
-    imghdr = ImghdrModule()
-    
-    # Add it to sys.modules so imports work
-    sys.modules['imghdr'] = imghdr 
\ No newline at end of file
+    imghdr = types.ModuleType('imghdr', "Minimal imghdr module replacement")
+
+    def what(file, h=None):
+        """Return the type of image contained in a file or byte stream."""
+        # Return None for all cases since we don't need actual image detection
+        return None
+
+    imghdr.what = what
+
+    # Add it to sys.modules so imports work, without replacing a loaded module
+    sys.modules.setdefault('imghdr', imghdr)
@@ -3,13 +3,26 @@
 # Import compatibility fix for Python 3.13
 import compatibility_fix
 
+# Suppress SSL warnings for self-signed certificates
+import urllib3
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
 import json
 import os
-import keyring
-import tkinter as tk
-from tkinter import ttk, messagebox
+import re
 from typing import Optional, Dict
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional faster JSON backend
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Input validation patterns
+_URL_RE = re.compile(r'^https?://')
+_EMAIL_RE = re.compile(r'[^@]+@[^@]+')
 
 class ConfigManager:
     """Manages JIRA configuration and credentials"""
@@ -20,9 +33,13 @@ class ConfigManager:
         self.username_key = "jira_username"
         self.api_token_key = "jira_api_token"
         self.url_key = "jira_url"
+        self._cached_config: Optional[Dict[str, str]] = None
+        
+    def get_config(self, force_reload: bool = False) -> Dict[str, str]:
+        """Get current configuration (cached after the first load)"""
+        if self._cached_config is not None and not force_reload:
+            return dict(self._cached_config)
         
-    def get_config(self) -> Dict[str, str]:
-        """Get current configuration"""
         config = {
             'url': 'https://your-jira-instance.atlassian.net',
             'email': '',
@@ -32,17 +49,22 @@ class ConfigManager:
         # Try to load from file first
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    file_config = json.load(f)
-                    config.update(file_config)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                file_config = orjson.loads(data) if orjson else json.loads(data)
+                config.update(file_config)
             except Exception:
                 pass
         
         # Try to get credentials from keychain
         try:
-            username = keyring.get_password(self.service_name, self.username_key)
-            api_token = keyring.get_password(self.service_name, self.api_token_key)
-            url = keyring.get_password(self.service_name, self.url_key)
+            import keyring
+            
+            # Lookups are independent and block on the OS credential store
+            keys = [self.username_key, self.api_token_key, self.url_key]
+            with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+                username, api_token, url = executor.map(
+                    lambda key: keyring.get_password(self.service_name, key), keys)
             
             if username:
                 config['email'] = username
@@ -54,7 +76,8 @@ class ConfigManager:
             # Keyring might not be available, continue with file config
             pass
         
-        return config
+        self._cached_config = config
+        return dict(config)
     
     def save_config(self, url: str, email: str, api_token: str):
         """Save configuration to file and keychain"""
@@ -67,22 +90,34 @@ class ConfigManager:
         # Save to file (without sensitive data)
         file_config = {'url': url}
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(file_config, f, indent=2)
+            # Indented since users may edit this file by hand
+            if orjson:
+                data = orjson.dumps(file_config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(file_config, indent=2).encode()
+            with open(self.config_file, 'wb') as f:
+                f.write(data)
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
         
         # Save sensitive data to keychain
         try:
+            import keyring
+            
             keyring.set_password(self.service_name, self.username_key, email)
             keyring.set_password(self.service_name, self.api_token_key, api_token)
             keyring.set_password(self.service_name, self.url_key, url)
         except Exception as e:
             print(f"Warning: Could not save to keychain: {e}")
+        
+        self._cached_config = config
     
     def clear_credentials(self):
         """Clear stored credentials"""
+        self._cached_config = None
         try:
+            import keyring
+            
             keyring.delete_password(self.service_name, self.username_key)
             keyring.delete_password(self.service_name, self.api_token_key)
             keyring.delete_password(self.service_name, self.url_key)
@@ -96,36 +131,46 @@ class ConfigManager:
             except Exception:
                 pass
 
+# tkinter is only needed by CredentialsDialog, so it is imported when the first one opens
+tk = ttk = messagebox = None
+
+def _import_tkinter():
+    """Import tkinter into the module globals used by CredentialsDialog"""
+    global tk, ttk, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk, messagebox
+        tk = tkinter
+
 class CredentialsDialog:
     """Dialog for entering JIRA credentials"""
     
     def __init__(self, parent, config_manager: ConfigManager):
+        _import_tkinter()
+        
         self.parent = parent
         self.config_manager = config_manager
         self.result = None
         
         # Create dialog
+        width, height = 700, 600  # Increased width for better button spacing
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("JIRA Configuration")
-        self.dialog.geometry("700x600")  # Increased width for better button spacing
         self.dialog.resizable(False, False)
-        self.dialog.minsize(700, 600)  # Set minimum size to ensure buttons are visible
+        self.dialog.minsize(width, height)  # Set minimum size to ensure buttons are visible
         
-        # Force the dialog to update its geometry
-        self.dialog.update_idletasks()
-        
-        # Make dialog modal
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        # Size and center dialog in one step; the size is fixed, so no layout pass is needed
+        x = (self.dialog.winfo_screenwidth() - width) // 2
+        y = (self.dialog.winfo_screenheight() - height) // 2
+        self.dialog.geometry(f"{width}x{height}+{x}+{y}")
         
         self.create_widgets()
         self.load_existing_config()
+        
+        # Make dialog modal (the window must be mapped before it can grab input)
+        self.dialog.transient(parent)
+        self.dialog.update_idletasks()
+        self.dialog.grab_set()
     
     def create_widgets(self):
         """Create dialog widgets with simple pack layout"""
@@ -231,18 +276,18 @@ class CredentialsDialog:
             return
         
         # Validate URL format
-        if not url.startswith(('http://', 'https://')):
+        if not _URL_RE.match(url):
             self.status_var.set("✗ JIRA URL must start with http:// or https://")
             return
         
         # Validate email format
-        if '@' not in email:
+        if not _EMAIL_RE.match(email):
             self.status_var.set("✗ Please enter a valid email address")
             return
         
         self.status_var.set("Testing connection...")
         self.test_btn.config(text="Testing...", state="disabled")
-        self.dialog.update()
+        self.dialog.update_idletasks()
         
         # Set a timeout to re-enable the button after 30 seconds
         self.dialog.after(30000, lambda: self.test_btn.config(text="🔍 Test Connection", state="normal") if self.test_btn.winfo_exists() else None)
@@ -251,11 +296,6 @@ class CredentialsDialog:
         def run_test():
             try:
                 from jira import JIRA
-                import requests
-                
-                # Suppress SSL warnings for self-signed certificates
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
                 
                 # Create JIRA client with timeout, API v3, and SSL verification disabled for self-signed certs
                 jira = JIRA(server=url, basic_auth=(email, api_token), 
@@ -316,12 +356,12 @@ class CredentialsDialog:
             return
         
         # Validate URL format
-        if not url.startswith(('http://', 'https://')):
+        if not _URL_RE.match(url):
             messagebox.showerror("Error", "JIRA URL must start with http:// or https://")
             return
         
         # Validate email format
-        if '@' not in email:
+        if not _EMAIL_RE.match(email):
             messagebox.showerror("Error", "Please enter a valid email address")
             return
         
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+"""
+Shared pytest fixtures for the test scripts.
+"""
+
+import pytest
+
+@pytest.fixture(scope='session')
+def tk_root():
+    """One hidden Tk root shared by every test, so Tcl/Tk starts up only once"""
+    import tkinter as tk
+    
+    root = tk.Tk()
+    root.withdraw()  # Hide the main window
+    yield root
+    root.destroy()
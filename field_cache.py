@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""
+On-disk cache of the JIRA field catalog, shared by jira_clone.py and check_link.py.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+# Optional faster JSON backend
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One file per JIRA URL; both tools read and write the same copy
+FIELD_CACHE_DIR = os.path.expanduser('~/.cache/jira_sync_tool')
+FIELD_CACHE_TTL = 60 * 60  # seconds
+
+def field_cache_path(jira_url):
+    """Get the field catalog cache file for a JIRA URL"""
+    url_hash = hashlib.blake2s(jira_url.encode()).hexdigest()[:16]
+    return os.path.join(FIELD_CACHE_DIR, f"fields-{url_hash}.json")
+
+def load_field_catalog(jira, jira_url):
+    """Get the field catalog from the disk cache, or from JIRA when stale"""
+    cache_path = field_cache_path(jira_url)
+    try:
+        if os.path.getmtime(cache_path) > time.time() - FIELD_CACHE_TTL:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
+    except (OSError, ValueError):
+        pass
+    
+    fields = jira.fields()
+    try:
+        os.makedirs(FIELD_CACHE_DIR, exist_ok=True)
+        # Written compactly: the catalog is large and never edited by hand
+        if orjson:
+            data = orjson.dumps(fields)
+        else:
+            data = json.dumps(fields, separators=(',', ':')).encode()
+        with open(cache_path, 'wb') as f:
+            f.write(data)
+    except OSError:
+        pass
+    return fields
+
+def clear_field_cache(jira_url):
+    """Remove the cached field catalog so the next lookup fetches it from JIRA"""
+    try:
+        os.remove(field_cache_path(jira_url))
+    except FileNotFoundError:
+        pass
@@ -8,15 +8,33 @@ import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 from jira import JIRA
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 import logging
 import argparse
+import atexit
+import io
+import re
 from typing import Dict, List, Optional, Tuple, Any
 import os
 import sys
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import zip_longest
+from collections import deque
+from contextlib import contextmanager
+from functools import cached_property
+
+from field_cache import load_field_catalog, clear_field_cache
+
+# Optional faster JSON backend
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -37,10 +55,23 @@ def set_jira_config(config):
     JIRA_EMAIL = config.get('email', JIRA_EMAIL)
     JIRA_API_TOKEN = config.get('api_token', JIRA_API_TOKEN)
 
-TARGET_DATE_FIELDS = [
+# Maximum number of ideas processed at once during bulk sync
+BULK_CONCURRENCY = 8
+
+def set_bulk_concurrency(concurrency: int):
+    """Set how many ideas bulk sync processes at once (takes effect for new clients)"""
+    global BULK_CONCURRENCY
+    BULK_CONCURRENCY = max(1, concurrency)
+
+# Per-field fallback PUTs sent at once for one issue. The client's connection pool
+# holds two connections per bulk worker, so this keeps every request on a pooled connection.
+FIELD_UPDATE_CONCURRENCY = 2
+
+TARGET_DATE_FIELDS = (
     'PRD Due Date', 'PRD Review Due Date', 'Start date', 'Code Complete Target',
     'Release candidate Target', 'Preview Est. Date', 'GA Estimated Date'
-]
+)
+TARGET_DATE_FIELDS_SET = frozenset(TARGET_DATE_FIELDS)
 
 FIELD_MAPPINGS = {
     'customfield_10015': 'customfield_13039',  # Start date (date ↔ string)
@@ -59,21 +90,125 @@ FIELD_MAPPINGS = {
     'customfield_12967': 'customfield_10064',
 }
 
+# Common emojis that take more visual space, mapped to two characters so
+# len() of the translated text gives the display width
+WIDE_CHAR_TABLE = str.maketrans({char: char * 2 for char in '✅❌⚠️⏭️📋🚀🔍📊📤📥🗺️'})
+
+# (bulk result status, dry run) -> (symbol, result text, text shown when there is no ticket).
+# Any other status ('error') is shown like 'failed'.
+BULK_STATUS_DISPLAY = {
+    ('success', False): ("✓", "Synced", "-"),
+    ('success', True): ("✓", "Would sync", "-"),
+    ('skipped', False): ("!", "Skipped", "-"),
+    ('skipped', True): ("!", "Would skip", "-"),
+    ('no_link', False): ("!", "No linked ticket", "-"),
+    ('no_link', True): ("!", "No linked ticket", "-"),
+    ('failed', False): ("✗", "Failed", "Unknown"),
+    ('failed', True): ("!", "Would fail", "Unknown"),
+}
+
 # Global output queue for GUI integration
 output_queue = None
 
 def set_output_queue(queue):
     """Set the output queue for GUI integration"""
-    global output_queue
+    global output_queue, _output_sink
     output_queue = queue
+    # Rebind once here rather than checking for a queue on every print
+    _output_sink = _make_queue_print(queue) if queue is not None else _console_print
+
+# Console output is collected and written in batches rather than line by line.
+# Colour and hyperlink escapes are dropped when stdout is not a terminal.
+CONSOLE_FLUSH_LINES = 50
+ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m|\x1b\]8;;.*?\x1b\\')
+_console_buffer = io.StringIO()
+_console_pending = 0
+_console_lock = threading.Lock()
+_strip_ansi = not sys.stdout.isatty()
+
+def _console_print(message: str = "", end: str = "\n", flush: bool = False):
+    """Print to console, writing buffered lines every CONSOLE_FLUSH_LINES or when flush is set"""
+    global _console_pending
+    text = f"{message}{end}"
+    if _strip_ansi:
+        text = ANSI_ESCAPE_RE.sub('', text)
+    with _console_lock:
+        _console_buffer.write(text)
+        _console_pending += 1
+        if flush or _console_pending >= CONSOLE_FLUSH_LINES:
+            _write_console_buffer()
+
+def _write_console_buffer():
+    """Write out buffered console output (caller holds _console_lock)"""
+    global _console_pending
+    sys.stdout.write(_console_buffer.getvalue())
+    sys.stdout.flush()
+    _console_buffer.seek(0)
+    _console_buffer.truncate()
+    _console_pending = 0
+
+def flush_output():
+    """Write out any buffered console output"""
+    with _console_lock:
+        if _console_pending:
+            _write_console_buffer()
+
+atexit.register(flush_output)
 
-def gui_print(message):
-    """Print to GUI if available, otherwise to console"""
-    global output_queue
-    if output_queue:
-        output_queue.put(message)
+def prompt_input(prompt: str) -> str:
+    """Ask the user for input, showing any buffered output first"""
+    flush_output()
+    return input(prompt)
+
+def _make_queue_print(queue):
+    """Build a printer that sends messages to the GUI queue (print_kwargs are ignored)"""
+    put = queue.put
+    
+    def queue_print(message: str = "", **print_kwargs):
+        put(message)
+    
+    return queue_print
+
+# Where output goes: the GUI queue if set, otherwise the console
+_output_sink = _console_print
+
+# Output captured per thread, so concurrent bulk-sync workers don't interleave their lines
+_captured_output = threading.local()
+
+def gui_print(message: str = "", end: str = "\n", flush: bool = False):
+    """Print to GUI if available, otherwise to console (collected instead while capturing)"""
+    captured = getattr(_captured_output, 'lines', None)
+    if captured is not None:
+        captured.append((message, end))
     else:
-        print(message)
+        _output_sink(message, end=end, flush=flush)
+
+@contextmanager
+def capture_output():
+    """Collect this thread's output instead of printing it; yields the list of (message, end) pairs"""
+    _captured_output.lines = lines = []
+    try:
+        yield lines
+    finally:
+        _captured_output.lines = None
+
+def replay_output(lines: List[Tuple[str, str]]):
+    """Print output collected by capture_output"""
+    for message, end in lines:
+        _output_sink(message, end=end)
+
+# OSC 8 escape sequences for clickable terminal hyperlinks
+OSC8_PREFIX = "\033]8;;"
+OSC8_MID = "\033\\"
+OSC8_END = "\033]8;;\033\\"
+
+def hyperlink(url: str, text: str = None) -> str:
+    """Format a clickable terminal hyperlink (shows the URL unless text is given)"""
+    return f"{OSC8_PREFIX}{url}{OSC8_MID}{text or url}{OSC8_END}"
+
+def truncate(text: str, limit: int = 100) -> str:
+    """Shorten text to limit characters, marking the cut with '...'"""
+    return text if len(text) <= limit else text[:limit] + "..."
 
 def print_header(title: str, subtitle: str = ""):
     """Print a clean, professional header"""
@@ -108,8 +243,13 @@ def print_verbose(message: str, verbose: bool = False):
         gui_print(f"  {message}")
 
 def print_progress(current: int, total: int, item: str = ""):
-    """Print progress indicator"""
+    """Print progress indicator, redrawn at most once per whole percent"""
     percentage = (current / total) * 100 if total > 0 else 0
+    percent_step = int(percentage)
+    if current != 1 and current < total and percent_step == print_progress.last_step:
+        return
+    print_progress.last_step = percent_step
+    
     bar_length = 20
     filled_length = int(bar_length * current // total) if total > 0 else 0
     bar = '█' * filled_length + '░' * (bar_length - filled_length)
@@ -117,17 +257,19 @@ def print_progress(current: int, total: int, item: str = ""):
     if current == total:
         gui_print()  # New line when complete
 
+print_progress.last_step = None
+
 class ExecutionLogger:
     """Handles execution logging to file"""
     
-    def __init__(self):
-        self.log_file = "jira_clone_execution.log"
+    def __init__(self, log_file: Optional[str] = "jira_clone_execution.log"):
+        self.log_file = log_file  # None only collects entries, for merging into another logger
         self.execution_data = {
             'timestamp': datetime.now().isoformat(),
             'operation': None,
             'parameters': {},
             'results': {},
-            'summary': []
+            'summary': io.StringIO()  # Lines are written as they come, read once on save
         }
     
     def log_operation(self, operation: str, **kwargs):
@@ -141,10 +283,21 @@ class ExecutionLogger:
     
     def add_summary_line(self, line: str):
         """Add a line to the summary"""
-        self.execution_data['summary'].append(line)
+        self.execution_data['summary'].write(f"{line}\n")
+    
+    def add_summary_lines(self, lines: List[str]):
+        """Add several lines to the summary"""
+        if lines:
+            self.execution_data['summary'].write("\n".join(lines) + "\n")
+    
+    def merge_summary(self, other: 'ExecutionLogger'):
+        """Append another logger's summary lines to this one"""
+        self.execution_data['summary'].write(other.execution_data['summary'].getvalue())
     
     def save_to_file(self):
         """Save execution summary to file"""
+        if self.log_file is None:
+            return
         try:
             with open(self.log_file, 'w') as f:
                 f.write("=" * 80 + "\n")
@@ -164,11 +317,11 @@ class ExecutionLogger:
                     for key, value in self.execution_data['results'].items():
                         f.write(f"  {key}: {value}\n")
                 
-                if self.execution_data['summary']:
+                summary = self.execution_data['summary'].getvalue()
+                if summary:
                     f.write("\nDetailed Summary:\n")
                     f.write("-" * 40 + "\n")
-                    for line in self.execution_data['summary']:
-                        f.write(f"{line}\n")
+                    f.write(summary)
                 
                 f.write("\n" + "=" * 80 + "\n")
             
@@ -181,12 +334,14 @@ def create_table(headers: List[str], rows: List[List[str]], title: str = None) -
     if not rows:
         return "No data to display"
     
-    # Calculate column widths
-    col_widths = [len(header) for header in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+    # Stringify each cell once; cells beyond the headers are not shown
+    num_cols = len(headers)
+    str_rows = [[str(cell) for cell in row[:num_cols]] for row in rows]
+    
+    # Calculate column widths (rows may be shorter than the headers)
+    columns = zip_longest(*str_rows, fillvalue='')
+    col_widths = [max(len(header), max(map(len, column), default=0))
+                  for header, column in zip_longest(headers, columns, fillvalue=())]
     
     # Create separator line
     separator = "+" + "+".join("-" * (width + 2) for width in col_widths) + "+"
@@ -207,11 +362,10 @@ def create_table(headers: List[str], rows: List[List[str]], title: str = None) -
     table_lines.append(separator)
     
     # Data rows
-    for row in rows:
+    for row in str_rows:
         data_row = "|"
         for i, cell in enumerate(row):
-            if i < len(col_widths):
-                data_row += f" {str(cell).ljust(col_widths[i])} |"
+            data_row += f" {cell.ljust(col_widths[i])} |"
         table_lines.append(data_row)
     
     table_lines.append(separator)
@@ -223,7 +377,10 @@ def format_date_for_display(date_value: Any) -> str:
         return "Not set"
     
     date_str = str(date_value)
-    if 'T' in date_str:
+    if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+        # ISO date or datetime: the date is always the first 10 characters
+        date_str = date_str[:10]
+    elif 'T' in date_str:
         date_str = date_str.split('T')[0]
     elif ' ' in date_str:
         date_str = date_str.split(' ')[0]
@@ -242,18 +399,33 @@ class JiraClient:
         self.jira = self._create_jira_client()
         self.last_api_call = 0
         self.min_delay = 0.2  # Minimum delay between API calls
+        self._rate_lock = threading.Lock()
     
     def _rate_limit_delay(self):
-        """Ensure minimum delay between API calls"""
-        elapsed = time.time() - self.last_api_call
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
-        self.last_api_call = time.time()
+        """Ensure minimum delay between API calls (safe to call from several threads)"""
+        # Reserve the next call slot under the lock, then wait outside it
+        with self._rate_lock:
+            now = time.time()
+            wait = max(0.0, self.last_api_call + self.min_delay - now)
+            self.last_api_call = now + wait
+        if wait:
+            time.sleep(wait)
+    
+    @staticmethod
+    def _retry_after(error) -> Optional[float]:
+        """Get the Retry-After delay in seconds from a rate limit error, if Jira sent one"""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
     
     def _api_call_with_retry(self, func, *args, **kwargs):
-        """Execute API call with exponential backoff retry"""
-        max_retries = 3
+        """Execute API call, backing off only when Jira reports rate limiting"""
+        max_retries = 5
         base_delay = 1
+        max_delay = 60
         
         for attempt in range(max_retries):
             try:
@@ -263,10 +435,14 @@ class JiraClient:
                 error_str = str(e).lower()
                 
                 # Check for rate limiting errors
-                if 'rate limit' in error_str or 'too many requests' in error_str or '429' in error_str:
+                if (getattr(e, 'status_code', None) == 429 or 'rate limit' in error_str
+                        or 'too many requests' in error_str or '429' in error_str):
                     if attempt < max_retries - 1:
-                        # Exponential backoff with jitter
-                        delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
+                        # Honour Retry-After, else exponential backoff with jitter
+                        delay = self._retry_after(e)
+                        if delay is None:
+                            delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
+                        delay = min(max_delay, delay)
                         print_warning(f"Rate limited, waiting {delay:.1f}s before retry {attempt + 1}/{max_retries}")
                         time.sleep(delay)
                         continue
@@ -278,26 +454,81 @@ class JiraClient:
 
     def _create_jira_client(self):
         """Create a JIRA client with rate limiting, API v3, and SSL verification disabled for self-signed certs"""
-        return JIRA(server=JIRA_URL, basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN), 
-                   options={'rest_api_version': '3', 'verify': False})
+        jira = JIRA(server=JIRA_URL, basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN), 
+                    options={'rest_api_version': '3', 'verify': False})
+        
+        # All requests go to one host: keep a keep-alive connection per bulk worker.
+        # The adapter only pools connections; retries belong to the jira library's
+        # session and _api_call_with_retry, so one failure isn't retried at every layer.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=BULK_CONCURRENCY * 2, max_retries=0)
+        jira._session.mount('https://', adapter)
+        jira._session.mount('http://', adapter)
+        return jira
 
     def get_issue(self, issue_key: str):
         """Get issue with rate limiting"""
         return self._api_call_with_retry(self.jira.issue, issue_key)
 
+    def _put_fields(self, issue_key: str, fields: Dict[str, Any]):
+        """PUT field values straight to the issue resource (no need to fetch the Issue first)"""
+        url = self.jira._get_url(f'issue/{issue_key}')
+        payload = {'fields': fields}
+        data = orjson.dumps(payload) if orjson else json.dumps(payload)
+        self._api_call_with_retry(self.jira._session.put, url, data=data)
+    
+    @staticmethod
+    def _field_errors(error) -> Dict[str, str]:
+        """Get the per-field error messages from a failed issue update"""
+        response = getattr(error, 'response', None)
+        try:
+            return response.json().get('errors') or {}
+        except Exception:
+            return {}
+
     def update_issue_field(self, issue_key: str, field_id: str, value: Any) -> bool:
         """Update issue field with rate limiting"""
         try:
-            issue = self.get_issue(issue_key)
-            self._api_call_with_retry(issue.update, fields={field_id: value})
+            self._put_fields(issue_key, {field_id: value})
             return True
         except Exception as e:
             print_error(f"Failed to update {field_id} on {issue_key}: {str(e)}")
             return False
+    
+    def update_issue_fields(self, issue_key: str, fields: Dict[str, Any]) -> Dict[str, str]:
+        """Update several fields in a single request
+        
+        Jira applies all fields or none, so on failure nothing was updated.
+        
+        Returns:
+            Field ID -> error message for the fields Jira rejected; empty when the update succeeded.
+            If the error does not name any fields, every field is reported with it.
+        """
+        try:
+            self._put_fields(issue_key, fields)
+            return {}
+        except Exception as e:
+            return self._field_errors(e) or {field_id: str(e) for field_id in fields}
 
     def search_issues(self, *args, **kwargs):
         """Search issues with rate limiting"""
         return self._api_call_with_retry(self.jira.search_issues, *args, **kwargs)
+    
+    def iter_search_pages(self, jql: str, fields=None, page_size: int = 100):
+        """Yield (start_at, issues) for each page of a search until the results run out
+        
+        100 is the largest page size Jira Cloud allows.
+        """
+        start_at = 0
+        while True:
+            issues = self.search_issues(jql, startAt=start_at, maxResults=page_size, fields=fields)
+            if not issues:
+                return
+            yield start_at, issues
+            
+            # If we got fewer results than requested, we've reached the end
+            if len(issues) < page_size:
+                return
+            start_at += page_size
 
 class FieldMapper:
     """Handles field mapping and resolution"""
@@ -305,28 +536,44 @@ class FieldMapper:
     def __init__(self, jira_client: JiraClient):
         self.jira = jira_client.jira
         self._field_cache = None
+        self._mapping_cache = None
+        self._names_cache = None
+        self._resolved_cache = {}
     
     @property
     def all_fields(self) -> List[Dict]:
         """Cached field definitions"""
         if self._field_cache is None:
-            self._field_cache = self.jira.fields()
+            self._field_cache = self._load_fields()
         return self._field_cache
     
+    def _load_fields(self) -> List[Dict]:
+        """Load field definitions from the disk cache, or from Jira when stale"""
+        return load_field_catalog(self.jira, JIRA_URL)
+    
+    @property
+    def field_names(self) -> Dict[str, str]:
+        """Cached field ID -> display name lookup"""
+        if self._names_cache is None:
+            self._names_cache = {f['id']: f['name'] for f in self.all_fields}
+        return self._names_cache
+    
     def get_field_mapping(self) -> Dict[str, Dict]:
-        """Get enhanced field mapping for target date fields"""
+        """Get enhanced field mapping for target date fields (cached)"""
+        if self._mapping_cache is None:
+            self._mapping_cache = self._build_field_mapping()
+        return self._mapping_cache
+    
+    def _build_field_mapping(self) -> Dict[str, Dict]:
+        """Build field mapping for target date fields from the field definitions"""
         field_map = {}
         field_alternatives = {}
         
         # Group fields by name
         for field in self.all_fields:
-            if field['custom'] and field['name'] in TARGET_DATE_FIELDS:
-                name = field['name']
-                if name not in field_alternatives:
-                    field_alternatives[name] = []
-                
+            if field['custom'] and field['name'] in TARGET_DATE_FIELDS_SET:
                 schema_type = field.get('schema', {}).get('type', 'unknown')
-                field_alternatives[name].append({
+                field_alternatives.setdefault(field['name'], []).append({
                     'id': field['id'], 'type': schema_type
                 })
         
@@ -344,6 +591,18 @@ class FieldMapper:
         return field_map
     
     def resolve_field_for_issue(self, field_id: str, issue) -> Optional[str]:
+        """Resolve field ID that works for the given issue (cached per project and issue type)"""
+        # Project and issue type together select the field configuration
+        try:
+            cache_key = (field_id, issue.fields.project.key, issue.fields.issuetype.id)
+        except AttributeError:
+            return self._resolve_field(field_id, issue)
+        
+        if cache_key not in self._resolved_cache:
+            self._resolved_cache[cache_key] = self._resolve_field(field_id, issue)
+        return self._resolved_cache[cache_key]
+    
+    def _resolve_field(self, field_id: str, issue) -> Optional[str]:
         """Resolve field ID that works for the given issue"""
         # Try original field
         try:
@@ -378,6 +637,9 @@ class DateFieldProcessor:
     def format_date_string(date_value: Any) -> str:
         """Convert date to string format"""
         date_str = str(date_value)
+        if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+            # ISO date or datetime: the date is always the first 10 characters
+            return date_str[:10]
         if 'T' in date_str:
             date_str = date_str.split('T')[0]
         elif ' ' in date_str:
@@ -388,7 +650,10 @@ class DateFieldProcessor:
     def format_for_jpd(date_value: Any) -> str:
         """Format date for JPD JSON string format"""
         date_str = DateFieldProcessor.format_date_string(date_value)
-        return json.dumps({"start": date_str, "end": date_str})
+        payload = {"start": date_str, "end": date_str}
+        if orjson:
+            return orjson.dumps(payload).decode()
+        return json.dumps(payload, separators=(',', ':'))
     
     def extract_populated_fields(self, issue, field_mapping: Dict) -> Dict:
         """Extract populated date fields from issue"""
@@ -406,9 +671,9 @@ class DateFieldProcessor:
 class FieldLister:
     """Handles field listing functionality"""
     
-    def __init__(self, jira_client: JiraClient):
+    def __init__(self, jira_client: JiraClient, field_mapper: Optional[FieldMapper] = None):
         self.jira_client = jira_client
-        self.field_mapper = FieldMapper(jira_client)
+        self.field_mapper = field_mapper or FieldMapper(jira_client)
     
     def list_fields(self, issue_key: str, show_empty: bool = False) -> bool:
         """List fields in an issue"""
@@ -435,31 +700,29 @@ class FieldLister:
     
     def _categorize_fields(self, issue, show_empty: bool) -> Tuple[Dict, Dict]:
         """Categorize fields into populated and empty"""
-        field_lookup = {f['id']: f for f in self.field_mapper.all_fields}
         populated = {}
         empty = {}
+        fields = issue.fields
+        create_entry = self._create_field_entry
         
         if show_empty:
             # Check all fields
             for field in self.field_mapper.all_fields:
                 field_id = field['id']
                 try:
-                    value = getattr(issue.fields, field_id, None)
+                    value = getattr(fields, field_id, None)
                     target = populated if (value and value != [] and value != "") else empty
-                    target[field_id] = self._create_field_entry(field, value or None)
+                    target[field_id] = create_entry(field, value or None)
                 except:
-                    empty[field_id] = self._create_field_entry(field, None)
+                    empty[field_id] = create_entry(field, None)
         else:
-            # Only populated fields
-            for attr_name in dir(issue.fields):
-                if not attr_name.startswith('_'):
-                    try:
-                        value = getattr(issue.fields, attr_name, None)
-                        if value and value != [] and value != "":
-                            field_info = field_lookup.get(attr_name, {})
-                            populated[attr_name] = self._create_field_entry(field_info, value)
-                    except:
-                        continue
+            # Only populated fields: walk the issue's own field values rather than dir()
+            field_lookup = {f['id']: f for f in self.field_mapper.all_fields}
+            for field_id, value in vars(fields).items():
+                if field_id.startswith('_'):
+                    continue
+                if value and value != [] and value != "":
+                    populated[field_id] = create_entry(field_lookup.get(field_id, {}), value)
         
         return populated, empty
     
@@ -480,20 +743,20 @@ class FieldLister:
         """Display clean field summary"""
         # Focus on date fields for product managers
         date_fields = {k: v for k, v in populated.items() if v['is_date']}
-        target_date_fields = {k: v for k, v in date_fields.items() if v['name'] in TARGET_DATE_FIELDS}
+        target_date_fields = {k: v for k, v in date_fields.items() if v['name'] in TARGET_DATE_FIELDS_SET}
         
         if target_date_fields:
             print_section("🎯 Milestone Dates")
             for field_id, field in target_date_fields.items():
                 formatted_date = format_date_for_display(field['value']) if field['value'] != 'Not set' else 'Not set'
-                print(f"  {field['name']}: {formatted_date}")
+                gui_print(f"  {field['name']}: {formatted_date}")
         
         if date_fields and len(date_fields) > len(target_date_fields):
             print_section("🗓️ Other Dates")
             for field_id, field in date_fields.items():
-                if field['name'] not in TARGET_DATE_FIELDS:
+                if field['name'] not in TARGET_DATE_FIELDS_SET:
                     formatted_date = format_date_for_display(field['value']) if field['value'] != 'Not set' else 'Not set'
-                    print(f"  {field['name']}: {formatted_date}")
+                    gui_print(f"  {field['name']}: {formatted_date}")
         
         # Summary
         print_section("📊 Summary")
@@ -506,64 +769,28 @@ class DateFieldCloner:
     """Main class for cloning date fields between issues"""
     
     def __init__(self, quiet: bool = False, verbose: bool = False):
-        self.jira_client = JiraClient()
-        self.field_mapper = FieldMapper(self.jira_client)
-        self.processor = DateFieldProcessor()
-        self.field_lister = FieldLister(self.jira_client)
-        self.logger = self._create_logger()
+        self.logger = ExecutionLogger()
         self.quiet = quiet
         self.verbose = verbose
+        self._eng_ticket_cache: Dict[str, Optional[str]] = {}
+        self._jpd_cache: Dict[Tuple[str, str], bool] = {}
     
-    def _create_logger(self):
-        """Create execution logger"""
-        return {
-            'log_file': "jira_clone_execution.log",
-            'data': {
-                'timestamp': datetime.now().isoformat(),
-                'operation': None,
-                'parameters': {},
-                'results': {},
-                'summary': []
-            }
-        }
+    # Subsystems are built on first use, so commands like --show-mapping never connect to Jira
+    @cached_property
+    def jira_client(self) -> JiraClient:
+        return JiraClient()
     
-    def _log_operation(self, operation: str, **kwargs):
-        """Log the operation and parameters"""
-        self.logger['data']['operation'] = operation
-        self.logger['data']['parameters'].update(kwargs)
+    @cached_property
+    def field_mapper(self) -> FieldMapper:
+        return FieldMapper(self.jira_client)
     
-    def _save_execution_log(self):
-        """Save execution summary to file"""
-        try:
-            with open(self.logger['log_file'], 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write(f"JIRA Clone Tool Execution Summary\n")
-                f.write(f"Generated: {self.logger['data']['timestamp']}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                f.write(f"Operation: {self.logger['data']['operation']}\n")
-                
-                if self.logger['data']['parameters']:
-                    f.write("\nParameters:\n")
-                    for key, value in self.logger['data']['parameters'].items():
-                        f.write(f"  {key}: {value}\n")
-                
-                if self.logger['data']['results']:
-                    f.write("\nResults:\n")
-                    for key, value in self.logger['data']['results'].items():
-                        f.write(f"  {key}: {value}\n")
-                
-                if self.logger['data']['summary']:
-                    f.write("\nDetailed Summary:\n")
-                    f.write("-" * 40 + "\n")
-                    for line in self.logger['data']['summary']:
-                        f.write(f"{line}\n")
-                
-                f.write("\n" + "=" * 80 + "\n")
-            
-            print_info(f"Execution summary saved to: {self.logger['log_file']}")
-        except Exception as e:
-            print_warning(f"Could not save execution log: {str(e)}")
+    @cached_property
+    def processor(self) -> DateFieldProcessor:
+        return DateFieldProcessor()
+    
+    @cached_property
+    def field_lister(self) -> FieldLister:
+        return FieldLister(self.jira_client, self.field_mapper)
     
     def _create_table(self, headers: List[str], rows: List[List[str]], title: str = None) -> str:
         """Create a clean, well-formatted text table"""
@@ -573,13 +800,8 @@ class DateFieldCloner:
         # Calculate column widths, accounting for emoji display width
         def display_width(text):
             """Calculate display width accounting for emojis"""
-            emoji_count = 0
-            for char in str(text):
-                # Count common emojis that take more visual space
-                if char in '✅❌⚠️⏭️📋🚀🔍📊📤📥🗺️':
-                    emoji_count += 1
             # Emojis typically display as 2 characters wide but count as 1
-            return len(str(text)) + emoji_count
+            return len(str(text).translate(WIDE_CHAR_TABLE))
         
         col_widths = [display_width(header) for header in headers]
         for row in rows:
@@ -621,100 +843,155 @@ class DateFieldCloner:
         table_lines.append(separator)
         return "\n".join(table_lines)
     
+    def _is_jpd_issue(self, issue) -> bool:
+        """Check if issue is JPD (cached per project and issue type)"""
+        try:
+            cache_key = (issue.fields.project.key, issue.fields.issuetype.id)
+        except AttributeError:
+            return self.processor.is_jpd_issue(issue)
+        
+        is_jpd = self._jpd_cache.get(cache_key)
+        if is_jpd is None:
+            is_jpd = self._jpd_cache[cache_key] = self.processor.is_jpd_issue(issue)
+        return is_jpd
+    
+    def invalidate_cache(self):
+        """Forget cached idea -> engineering ticket lookups (e.g. after links change)"""
+        self._eng_ticket_cache.clear()
+    
     def find_linked_engineering_ticket(self, jpd_key: str) -> Optional[str]:
-        """Find the linked engineering ticket for a JPD idea"""
+        """Find the linked engineering ticket for a JPD idea (cached per idea)"""
+        return self._find_linked_engineering_ticket(jpd_key)[0]
+    
+    def _find_linked_engineering_ticket(self, jpd_key: str) -> Tuple[Optional[str], Any]:
+        """Find the linked engineering ticket for a JPD idea
+        
+        Returns:
+            (eng_key, jpd_issue) where jpd_issue is the idea if it had to be fetched, else None
+        """
+        if jpd_key in self._eng_ticket_cache:
+            return self._eng_ticket_cache[jpd_key], None
+        
         issue = self.jira_client.get_issue(jpd_key)
+        eng_key = None
         if not issue:
-            return None
-        
-        # Check if it's actually a JPD issue
-        if not self.processor.is_jpd_issue(issue):
+            pass
+        elif not self.processor.is_jpd_issue(issue):
+            # Check if it's actually a JPD issue
             print_warning(f"{jpd_key} is not a JPD idea")
-            return None
+        else:
+            # Look for linked engineering tickets
+            try:
+                eng_key = self._linked_engineering_key(issue)
+            except Exception as e:
+                print_info(f"Could not check issue links: {str(e)}")
         
-        # Look for linked engineering tickets
-        try:
-            if hasattr(issue.fields, 'issuelinks') and issue.fields.issuelinks:
-                for link in issue.fields.issuelinks:
-                    linked_issue_key = None
-                    
-                    # Check both directions of the link
-                    if hasattr(link, 'outwardIssue') and link.outwardIssue:
-                        linked_issue_key = link.outwardIssue.key
-                    elif hasattr(link, 'inwardIssue') and link.inwardIssue:
-                        linked_issue_key = link.inwardIssue.key
-                    
-                    # If we found a non-JPD issue, it's likely the engineering ticket
-                    if linked_issue_key and not linked_issue_key.startswith('IDEA-'):
-                        return linked_issue_key
-        except Exception as e:
-            print_info(f"Could not check issue links: {str(e)}")
+        self._eng_ticket_cache[jpd_key] = eng_key
+        return eng_key, issue
+    
+    @staticmethod
+    def _linked_engineering_key(issue) -> Optional[str]:
+        """Get the engineering ticket key from an idea's issue links"""
+        if hasattr(issue.fields, 'issuelinks') and issue.fields.issuelinks:
+            for link in issue.fields.issuelinks:
+                linked_issue_key = None
+                
+                # Check both directions of the link
+                if hasattr(link, 'outwardIssue') and link.outwardIssue:
+                    linked_issue_key = link.outwardIssue.key
+                elif hasattr(link, 'inwardIssue') and link.inwardIssue:
+                    linked_issue_key = link.inwardIssue.key
+                
+                # If we found a non-JPD issue, it's likely the engineering ticket
+                if linked_issue_key and not linked_issue_key.startswith('IDEA-'):
+                    return linked_issue_key
         
         return None
     
     def get_jpd_ideas_in_project(self, project_key: str) -> List[str]:
-        """Get all JPD ideas in a project using pagination with rate limiting"""
+        """Get all JPD ideas in a project using pagination with rate limiting
+        
+        The same search returns each idea's issue links, which are recorded so
+        find_linked_engineering_ticket needs no further request per idea.
+        """
+        return [issue.key for issue in self._fetch_jpd_ideas(project_key, 'issuelinks')]
+    
+    def _fetch_jpd_ideas(self, project_key: str, fields) -> List:
+        """Fetch all JPD ideas in a project (with the given fields), recording their linked tickets"""
         try:
             # Query for all ideas in the project with pagination
             jql = f'project = "{project_key}" AND issuetype = "Idea"'
-            all_issues = []
-            start_at = 0
-            max_results = 50  # Reduced batch size to be gentler on API
+            ideas = []
             
-            while True:
-                print_info(f"Fetching ideas {start_at + 1}-{start_at + max_results}...")
-                
-                # Use rate-limited search
-                issues = self.jira_client.search_issues(
-                    jql, 
-                    startAt=start_at, 
-                    maxResults=max_results, 
-                    fields='key,summary'
-                )
-                
-                print_info(f"Got {len(issues)} issues in this batch")
-                
-                if not issues:
-                    print_info("No more issues found, stopping pagination")
-                    break
+            for start_at, issues in self.jira_client.iter_search_pages(jql, fields=fields):
+                print_info(f"Got {len(issues)} issues from {start_at + 1}")
                 
-                all_issues.extend(issues)
-                
-                # If we got fewer results than requested, we've reached the end
-                if len(issues) < max_results:
-                    print_info(f"Got {len(issues)} < {max_results}, reached end of results")
-                    break
-                
-                start_at += max_results
-                
-                # Add delay between pagination requests to avoid overwhelming API
-                time.sleep(0.3)
+                ideas.extend(issues)
+                for issue in issues:
+                    try:
+                        self._eng_ticket_cache[issue.key] = self._linked_engineering_key(issue)
+                    except Exception:
+                        # Fall back to fetching this idea individually
+                        self._eng_ticket_cache.pop(issue.key, None)
             
-            idea_keys = [issue.key for issue in all_issues]
-            print_info(f"Found {len(idea_keys)} total ideas in project {project_key}")
+            print_info(f"Found {len(ideas)} total ideas in project {project_key}")
             
-            return idea_keys
+            return ideas
         except Exception as e:
             print_error(f"Failed to get ideas from project {project_key}: {str(e)}")
             return []
     
+    def _prefetch_issues(self, issue_keys: List[str], fields) -> Dict[str, Any]:
+        """Fetch issues in batches of key in (...) searches instead of one GET each
+        
+        Issues that cannot be fetched here are left out; callers fall back to get_issue.
+        """
+        prefetched = {}
+        batch_size = 100
+        for i in range(0, len(issue_keys), batch_size):
+            batch = issue_keys[i:i + batch_size]
+            jql = f"key in ({','.join(batch)})"
+            try:
+                for _, issues in self.jira_client.iter_search_pages(jql, fields=fields, page_size=batch_size):
+                    prefetched.update((issue.key, issue) for issue in issues)
+            except Exception as e:
+                print_verbose(f"Could not prefetch issues {batch[0]}..{batch[-1]}: {str(e)}", self.verbose)
+        return prefetched
+    
     def bulk_sync_project(self, project_key: str, dry_run: bool = False, force: bool = False) -> bool:
-        """Auto-sync dates for all ideas in a JPD project"""
-        self._log_operation(f"Bulk Sync Project", project=project_key, dry_run=dry_run)
+        """Auto-sync dates for all ideas in a JPD project
+        
+        Ideas are never confirmed one by one: callers confirm the whole run up front
+        (as main does unless --force is given), so force is not needed here.
+        """
+        self.logger.log_operation(f"Bulk Sync Project", project=project_key, dry_run=dry_run)
         
         mode_text = " (dry run)" if dry_run else ""
         if not self.quiet:
             print_header(f"Bulk sync: {project_key}{mode_text}")
         
+        # The field mapping is the same for every idea: resolve it once up front
+        field_mapping = self.field_mapper.get_field_mapping()
+        
+        # Fetch every idea and its linked engineering ticket in batched searches,
+        # with just the fields a sync reads, rather than several GETs per idea
+        sync_fields = ['summary', 'project', 'issuetype', 'issuelinks']
+        sync_fields.extend(info['id'] for info in field_mapping.values())
+        
         # Get all ideas in the project
         if not self.quiet:
             print_info("Discovering JPD ideas...")
-        idea_keys = self.get_jpd_ideas_in_project(project_key)
+        ideas = self._fetch_jpd_ideas(project_key, sync_fields)
         
-        if not idea_keys:
+        if not ideas:
             print_error(f"No ideas found in project {project_key}")
             return False
         
+        idea_keys = [idea.key for idea in ideas]
+        prefetched = {idea.key: idea for idea in ideas}
+        eng_keys = {self._eng_ticket_cache.get(key) for key in idea_keys} - {None}
+        prefetched.update(self._prefetch_issues(sorted(eng_keys), sync_fields))
+        
         if not self.quiet:
             action_text = "Would process" if dry_run else "Processing"
             print_info(f"{action_text} {len(idea_keys)} ideas")
@@ -726,60 +1003,38 @@ class DateFieldCloner:
             'no_links': 0,
             'skipped': 0,
             'failed': 0,
-            'details': []
+            'details': deque()  # Only appended to, then iterated once for the summary
         }
         
         # Process each idea
-        for i, idea_key in enumerate(idea_keys, 1):
-            if not self.quiet and not self.verbose:
-                print_progress(i, len(idea_keys), idea_key)
-            elif self.verbose:
-                print_section(f"Processing {i}/{len(idea_keys)}: {idea_key}")
-            
-            # Find linked engineering ticket
-            eng_ticket = self.find_linked_engineering_ticket(idea_key)
-            
-            if not eng_ticket:
-                print_verbose(f"No linked engineering ticket found for {idea_key}", self.verbose)
+        outcomes = self._process_ideas_concurrently(idea_keys, dry_run, field_mapping, prefetched)
+        
+        append_detail = results['details'].append
+        for idea_key, (status, eng_ticket) in zip(idea_keys, outcomes):
+            if status == 'no_link':
                 results['no_links'] += 1
-                results['details'].append((idea_key, 'no_link', None))
+                append_detail((idea_key, 'no_link', None))
                 continue
             
-            print_verbose(f"Found linked ticket: {eng_ticket}", self.verbose)
-            
-            # Try to sync
-            try:
-                success, status = self._clone_fields_with_status(eng_ticket, idea_key, dry_run=dry_run, force=force)
-                if success:
-                    results['successful'] += 1
-                    results['details'].append((idea_key, 'success', eng_ticket))
-                    if self.verbose:
-                        action_text = "Would sync" if dry_run else "Synced"
-                        print_success(f"{action_text} {idea_key} ← {eng_ticket}")
-                elif status == 'skipped':
-                    results['skipped'] += 1
-                    results['details'].append((idea_key, 'skipped', eng_ticket))
-                    if self.verbose:
-                        action_text = "Would skip" if dry_run else "Skipped"
-                        print_warning(f"{action_text} {idea_key} ← {eng_ticket}")
-                else:  # status == 'failed'
-                    if not dry_run:  # Don't count as failed in dry run
-                        results['failed'] += 1
-                        results['details'].append((idea_key, 'failed', eng_ticket))
-                        if self.verbose:
-                            print_error(f"Failed {idea_key} ← {eng_ticket}")
-            except Exception as e:
-                if not dry_run:  # Don't count as error in dry run
-                    results['failed'] += 1
-                    results['details'].append((idea_key, 'error', eng_ticket))
-                    if self.verbose:
-                        print_error(f"Error syncing {idea_key}: {str(e)}")
+            if status == 'success':
+                results['successful'] += 1
+                append_detail((idea_key, 'success', eng_ticket))
+                if self.verbose:
+                    action_text = "Would sync" if dry_run else "Synced"
+                    print_success(f"{action_text} {idea_key} ← {eng_ticket}")
+            elif status == 'skipped':
+                results['skipped'] += 1
+                append_detail((idea_key, 'skipped', eng_ticket))
+                if self.verbose:
+                    action_text = "Would skip" if dry_run else "Skipped"
+                    print_warning(f"{action_text} {idea_key} ← {eng_ticket}")
+            elif not dry_run:  # 'failed' or 'error'; don't count as failed in dry run
+                results['failed'] += 1
+                append_detail((idea_key, status, eng_ticket))
+                if self.verbose and status == 'failed':
+                    print_error(f"Failed {idea_key} ← {eng_ticket}")
             
             results['processed'] += 1
-            
-            # Add progressive delay to avoid overwhelming the API (longer for larger projects)
-            delay = 0.1 if dry_run else min(1.0, 0.3 + (i / 100))  # Progressive delay: 0.3s to 1.0s
-            time.sleep(delay)
         
         # Final summary
         if not self.quiet:
@@ -788,15 +1043,95 @@ class DateFieldCloner:
             # Minimal output for quiet mode
             if results['successful'] > 0:
                 action = "Would sync" if dry_run else "Synced"
-                print(f"{action}: {results['successful']}")
+                gui_print(f"{action}: {results['successful']}")
             if results['failed'] > 0 and not dry_run:
-                print(f"Failed: {results['failed']}")
+                gui_print(f"Failed: {results['failed']}")
         
         # Save execution log
-        self._save_execution_log()
+        self.logger.save_to_file()
         
         return results['successful'] > 0
     
+    def _process_ideas_concurrently(self, idea_keys: List[str], dry_run: bool, field_mapping: Dict,
+                                    prefetched: Dict[str, Any]) -> List[Tuple[str, Optional[str]]]:
+        """Process ideas on a pool of BULK_CONCURRENCY threads, preserving input order"""
+        total = len(idea_keys)
+        outcomes = [None] * total
+        
+        # The jira client is blocking; threads overlap the time spent waiting on HTTP.
+        # Each idea's output and log entries are handed back and emitted here, one idea at a time.
+        with ThreadPoolExecutor(max_workers=BULK_CONCURRENCY) as pool:
+            futures = {pool.submit(self._process_idea_isolated, key, dry_run, field_mapping, prefetched): i
+                       for i, key in enumerate(idea_keys)}
+            try:
+                for completed, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    try:
+                        outcomes[i], output, idea_logger = future.result()
+                    except Exception as e:
+                        # One idea failing must not abort the run or lose the other ideas' results
+                        outcomes[i] = 'error', self._eng_ticket_cache.get(idea_keys[i])
+                        output, idea_logger = [], None
+                        if self.verbose and not dry_run:
+                            print_error(f"Error syncing {idea_keys[i]}: {str(e)}")
+                    if self.verbose:
+                        print_section(f"Processed {completed}/{total}: {idea_keys[i]}")
+                    elif not self.quiet:
+                        print_progress(completed, total, idea_keys[i])
+                    replay_output(output)
+                    if idea_logger is not None:
+                        self.logger.merge_summary(idea_logger)
+            except BaseException:
+                # Ctrl-C or an error here: don't start any more ideas before giving up
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        return outcomes
+    
+    def _process_idea_isolated(self, idea_key: str, dry_run: bool, field_mapping: Dict,
+                               prefetched: Dict[str, Any]) -> Tuple[Tuple[str, Optional[str]], List, ExecutionLogger]:
+        """Run _process_idea on a worker thread with its own output buffer and execution logger
+        
+        Returns:
+            (outcome, output, logger) where outcome is what _process_idea returned
+        """
+        idea_logger = ExecutionLogger(log_file=None)
+        with capture_output() as output:
+            outcome = self._process_idea(idea_key, dry_run, field_mapping, prefetched, idea_logger)
+        return outcome, output, idea_logger
+    
+    def _process_idea(self, idea_key: str, dry_run: bool, field_mapping: Dict,
+                      prefetched: Dict[str, Any], logger: ExecutionLogger) -> Tuple[str, Optional[str]]:
+        """Find the linked engineering ticket for one idea and sync its dates
+        
+        Issues found in prefetched are used as-is instead of being fetched again.
+        The bulk run is confirmed up front, so the sync never prompts per idea.
+        Log entries go to logger, which the bulk run merges into its own.
+        
+        Returns:
+            (status, eng_ticket) where status is 'success', 'skipped', 'failed', 'error' or 'no_link'
+        """
+        eng_ticket = self.find_linked_engineering_ticket(idea_key)
+        
+        if not eng_ticket:
+            print_verbose(f"No linked engineering ticket found for {idea_key}", self.verbose)
+            return 'no_link', None
+        
+        print_verbose(f"Found linked ticket: {eng_ticket}", self.verbose)
+        
+        try:
+            success, status = self._clone_fields_with_status(eng_ticket, idea_key, dry_run=dry_run, force=True,
+                                                           field_mapping=field_mapping,
+                                                           source_issue=prefetched.get(eng_ticket),
+                                                           target_issue=prefetched.get(idea_key),
+                                                           logger=logger)
+        except Exception as e:
+            if self.verbose and not dry_run:
+                print_error(f"Error syncing {idea_key}: {str(e)}")
+            return 'error', eng_ticket
+        
+        return ('success' if success else status), eng_ticket
+    
     def _print_bulk_summary(self, project_key: str, results: dict, dry_run: bool = False):
         """Print bulk sync summary following Google CLI best practices"""
         mode_text = " (dry run)" if dry_run else ""
@@ -836,7 +1171,7 @@ class DateFieldCloner:
             self._print_detailed_results(results, dry_run)
         
         # Log results
-        self.logger['data']['results'] = {
+        self.logger.log_results({
             'project': project_key,
             'dry_run': dry_run,
             'successful': results['successful'],
@@ -844,68 +1179,54 @@ class DateFieldCloner:
             'no_links': results['no_links'], 
             'failed': results['failed'],
             'total_processed': results['processed']
-        }
+        })
     
     def _print_detailed_results(self, results: dict, dry_run: bool):
         """Print detailed results table"""
         headers = ["Idea", "Status", "Engineering Ticket", "Result"]
         rows = []
         
+        failed_display = BULK_STATUS_DISPLAY['failed', dry_run]
         for idea_key, status, eng_ticket in results['details']:
-            if status == 'success':
-                status_symbol = "✓"
-                result = "Would sync" if dry_run else "Synced"
-                eng_display = eng_ticket or "-"
-            elif status == 'skipped':
-                status_symbol = "!"
-                result = "Would skip" if dry_run else "Skipped"
-                eng_display = eng_ticket or "-"
-            elif status == 'no_link':
-                status_symbol = "!"
-                result = "No linked ticket"
-                eng_display = "-"
-            else:
-                status_symbol = "✗" if not dry_run else "!"
-                result = "Failed" if not dry_run else "Would fail"
-                eng_display = eng_ticket or "Unknown"
-            
-            rows.append([idea_key, status_symbol, eng_display, result])
+            status_symbol, result, missing_ticket = BULK_STATUS_DISPLAY.get((status, dry_run), failed_display)
+            rows.append([idea_key, status_symbol, eng_ticket or missing_ticket, result])
         
         table = self._create_table(headers, rows)
-        print(table)
+        gui_print(table)
         
         # Log table to summary
-        self.logger['data']['summary'].append("Detailed Results:")
-        self.logger['data']['summary'].append(table)
+        self.logger.add_summary_line("Detailed Results:")
+        self.logger.add_summary_line(table)
 
     def auto_sync_from_jpd(self, jpd_key: str, force: bool = False) -> bool:
         """Auto-discover and sync dates from linked engineering ticket to JPD idea"""
-        self._log_operation(f"Auto Sync from JPD", jpd_idea=jpd_key)
+        self.logger.log_operation(f"Auto Sync from JPD", jpd_idea=jpd_key)
         
         print_header(f"🔍 Auto-discovering links for {jpd_key}")
         
-        # Find the linked engineering ticket
-        eng_ticket = self.find_linked_engineering_ticket(jpd_key)
+        # Find the linked engineering ticket, keeping the idea if it was fetched for it
+        eng_ticket, jpd_issue = self._find_linked_engineering_ticket(jpd_key)
         
         if not eng_ticket:
             print_error(f"No linked engineering ticket found for {jpd_key}")
             print_info("JPD idea must have a formal issue link to an engineering ticket")
-            self.logger['data']['results'] = {'status': 'no_linked_ticket', 'jpd_idea': jpd_key}
-            self._save_execution_log()
+            self.logger.log_results({'status': 'no_linked_ticket', 'jpd_idea': jpd_key})
+            self.logger.save_to_file()
             return False
         
         print_success(f"Found linked engineering ticket: {eng_ticket}")
         print_info(f"Will copy dates from {eng_ticket} to {jpd_key}")
         
         # Log the discovery
-        self.logger['data']['summary'].extend([
+        self.logger.add_summary_lines([
             f"Auto-discovery for JPD idea: {jpd_key}",
             f"Found linked engineering ticket: {eng_ticket}",
             "Proceeding with date sync..."
         ])
         
         # Proceed with normal sync
-        success = self.clone_fields(eng_ticket, jpd_key, dry_run=False, force=force)
+        success, _ = self._clone_fields_with_status(eng_ticket, jpd_key, dry_run=False, force=force,
+                                                    target_issue=jpd_issue)
         return success
 
     def check_links(self, issue1_key: str, issue2_key: str) -> bool:
@@ -920,7 +1241,8 @@ class DateFieldCloner:
         print_info(f"Searching {issue1_key} for references to '{issue2_key}'...")
         
         # Get all field names for display
-        field_names = {f['id']: f['name'] for f in self.field_mapper.all_fields}
+        field_names = self.field_mapper.field_names
+        needle = issue2_key.upper()  # Keys are compared case-insensitively
         references_found = []
         
         # Check issue links first
@@ -937,34 +1259,32 @@ class DateFieldCloner:
                         linked_issue = link.inwardIssue.key  
                         link_type = f"inward: {link.type.inward}"
                     
-                    if linked_issue and linked_issue.upper() == issue2_key.upper():
+                    if linked_issue and linked_issue.upper() == needle:
                         references_found.append(("Issue Links", f"{link_type} → {linked_issue}"))
         except Exception as e:
             print_info(f"Could not check issue links: {str(e)}")
         
-        # Check all other fields for text references
-        for field_id in dir(issue1.fields):
-            if field_id.startswith('_'):
+        # Check all other fields for text references, using the raw field values
+        field_texts = {}
+        for field_id, value in issue1.raw.get('fields', {}).items():
+            if not value or field_id == 'issuelinks':  # Links were checked above
                 continue
-                
-            try:
-                value = getattr(issue1.fields, field_id, None)
-                if value and str(value) and issue2_key.upper() in str(value).upper():
+            field_texts[field_id] = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        
+        # One scan over all field text; only look at individual fields if it matches
+        if needle in "\x1e".join(field_texts.values()).upper():
+            for field_id, text in field_texts.items():
+                if needle in text.upper():
                     field_name = field_names.get(field_id, field_id)
                     # Truncate long values for display
-                    display_value = str(value)
-                    if len(display_value) > 100:
-                        display_value = display_value[:100] + "..."
-                    references_found.append((field_name, display_value))
-            except:
-                continue
+                    references_found.append((field_name, truncate(text)))
         
         # Display results
         print_section("📊 Results")
         if references_found:
             print_success(f"Found {len(references_found)} reference(s) to '{issue2_key}':")
             for field_name, value in references_found:
-                print(f"  • {field_name}: {value}")
+                gui_print(f"  • {field_name}: {value}")
             return True
         else:
             print_warning(f"No references to '{issue2_key}' found in {issue1_key}")
@@ -974,26 +1294,26 @@ class DateFieldCloner:
         """Display field mapping information following Google CLI best practices"""
         print_header("Milestone Date Fields")
         
-        print("Available fields:")
+        gui_print("Available fields:")
         for field_name in TARGET_DATE_FIELDS:
-            print(f"  {field_name}")
-        
-        print("\nUsage:")
-        print("  jira_clone.py SOURCE TARGET          # Sync dates between issues")
-        print("  jira_clone.py --auto-sync IDEA       # Auto-discover linked ticket")
-        print("  jira_clone.py --bulk-sync PROJECT    # Bulk sync project ideas")
-        print("  jira_clone.py --list-fields ISSUE    # Show issue dates")
-        
-        print("\nOptions:")
-        print("  --dry-run    Preview changes without applying")
-        print("  --force      Skip confirmation prompts")
-        print("  --quiet      Minimal output")
-        print("  --verbose    Detailed output")
-        
-        print("\nNotes:")
-        print("  - Automatically detects field formats (Jira vs JPD)")
-        print("  - Maps fields by name between projects")
-        print("  - Requires valid JIRA authentication")
+            gui_print(f"  {field_name}")
+        
+        gui_print("\nUsage:")
+        gui_print("  jira_clone.py SOURCE TARGET          # Sync dates between issues")
+        gui_print("  jira_clone.py --auto-sync IDEA       # Auto-discover linked ticket")
+        gui_print("  jira_clone.py --bulk-sync PROJECT    # Bulk sync project ideas")
+        gui_print("  jira_clone.py --list-fields ISSUE    # Show issue dates")
+        
+        gui_print("\nOptions:")
+        gui_print("  --dry-run    Preview changes without applying")
+        gui_print("  --force      Skip confirmation prompts")
+        gui_print("  --quiet      Minimal output")
+        gui_print("  --verbose    Detailed output")
+        
+        gui_print("\nNotes:")
+        gui_print("  - Automatically detects field formats (Jira vs JPD)")
+        gui_print("  - Maps fields by name between projects")
+        gui_print("  - Requires valid JIRA authentication")
     
     def clone_fields(self, source_key: str, target_key: str, dry_run: bool = False, force: bool = False) -> bool:
         """Clone date fields between issues with clean output
@@ -1001,37 +1321,47 @@ class DateFieldCloner:
         Returns:
             success: bool
         """
-        success, _ = self._clone_fields_with_status(source_key, target_key, dry_run, force)
+        success, _ = self._clone_fields_with_status(source_key, target_key, dry_run=dry_run, force=force)
         return success
     
-    def _clone_fields_with_status(self, source_key: str, target_key: str, dry_run: bool = False, force: bool = False) -> tuple[bool, str]:
+    def _clone_fields_with_status(self, source_key: str, target_key: str, *, dry_run: bool = False, force: bool = False,
+                                  field_mapping: Optional[Dict] = None, source_issue=None,
+                                  target_issue=None, logger: Optional[ExecutionLogger] = None) -> tuple[bool, str]:
         """Clone date fields between issues with detailed status
         
+        Bulk callers pass a precomputed field_mapping and already fetched issues
+        so they are not looked up again for every idea, and a logger of their own.
+        
         Returns:
             (success: bool, status: str) where status is 'success', 'skipped', or 'failed'
         """
-        self._log_operation(f"Clone Fields", source=source_key, target=target_key, dry_run=dry_run)
+        if logger is None:
+            logger = self.logger
+        logger.log_operation(f"Clone Fields", source=source_key, target=target_key, dry_run=dry_run)
         
         # Get issues
-        source_issue = self.jira_client.get_issue(source_key)
-        target_issue = self.jira_client.get_issue(target_key)
+        if source_issue is None:
+            source_issue = self.jira_client.get_issue(source_key)
+        if target_issue is None:
+            target_issue = self.jira_client.get_issue(target_key)
         
         if not source_issue or not target_issue:
             print_warning("Cannot access issues. Check issue keys.")
-            self._save_execution_log()
+            logger.save_to_file()
             return False, 'skipped'
         
         # Analyze source
-        field_mapping = self.field_mapper.get_field_mapping()
+        if field_mapping is None:
+            field_mapping = self.field_mapper.get_field_mapping()
         populated_fields = self.processor.extract_populated_fields(source_issue, field_mapping)
         
         if not populated_fields:
             print_warning(f"No milestone dates in {source_key} - skipping")
-            self._save_execution_log()
+            logger.save_to_file()
             return False, 'skipped'
         
         # Show what will be copied
-        is_target_jpd = self.processor.is_jpd_issue(target_issue)
+        is_target_jpd = self._is_jpd_issue(target_issue)
         target_type = "JPD" if is_target_jpd else "Jira"
         
         mode_text = "DRY RUN" if dry_run else "SYNC"
@@ -1040,14 +1370,17 @@ class DateFieldCloner:
         action_text = "Would copy" if dry_run else "Copying"
         print_info(f"{action_text} {len(populated_fields)} dates:")
         
+        # Format each date once; the listing, log and dry-run table all reuse it
+        formatted_populated = {name: format_date_for_display(data['value'])
+                               for name, data in populated_fields.items()}
+        
         dates_list = []
-        for field_name, field_data in populated_fields.items():
-            formatted_date = format_date_for_display(field_data['value'])
-            print(f"  • {field_name}: {formatted_date}")
+        for field_name, formatted_date in formatted_populated.items():
+            gui_print(f"  • {field_name}: {formatted_date}")
             dates_list.append(f"{field_name}: {formatted_date}")
         
         # Log the dates being copied
-        self.logger['data']['summary'].extend([
+        logger.add_summary_lines([
             f"Operation: {mode_text}",
             f"Source: {source_key} ({source_issue.fields.issuetype.name})",
             f"Target: {target_key} ({target_type})",
@@ -1065,10 +1398,9 @@ class DateFieldCloner:
             
             # Check all target date fields, not just populated ones
             for target_field in TARGET_DATE_FIELDS:
-                if target_field in populated_fields:
+                if target_field in formatted_populated:
                     # Field has a value in source
-                    field_data = populated_fields[target_field]
-                    date_value = format_date_for_display(field_data['value'])
+                    date_value = formatted_populated[target_field]
                     status = "Would update"
                 else:
                     # Field is not set in source
@@ -1078,30 +1410,36 @@ class DateFieldCloner:
                 rows.append([target_field, date_value, status])
             
             table = self._create_table(headers, rows, f"Dry Run: {source_key} → {target_key}")
-            print(table)
+            gui_print(table)
             
             # Log results
-            self.logger['data']['results'] = {
+            logger.log_results({
                 'source': source_key,
                 'target': target_key,
                 'dry_run': True,
                 'fields_to_copy': len(populated_fields),
                 'total_target_fields': len(TARGET_DATE_FIELDS),
                 'status': 'preview_only'
-            }
+            })
             
-            self._save_execution_log()
+            logger.save_to_file()
             return True, 'success'
         
         # Confirm operation
         if force:
             print_info("Skipping confirmation with --force flag")
+        elif not sys.stdin.isatty():
+            # Nobody can answer the prompt, so don't block waiting for one
+            print_warning("Cannot confirm without an interactive terminal - use --force")
+            logger.log_results({'status': 'cancelled_no_terminal'})
+            logger.save_to_file()
+            return False, 'skipped'
         else:
-            response = input(f"\nProceed? (yes/no): ").strip().lower()
+            response = prompt_input(f"\nProceed? (yes/no): ").strip().lower()
             if response not in ['yes', 'y']:
                 print_info("Cancelled")
-                self.logger['data']['results'] = {'status': 'cancelled_by_user'}
-                self._save_execution_log()
+                logger.log_results({'status': 'cancelled_by_user'})
+                logger.save_to_file()
                 return False, 'skipped'
         
         # Execute cloning
@@ -1109,15 +1447,15 @@ class DateFieldCloner:
         
         # Log final results
         status = 'success' if success else 'failed'
-        self.logger['data']['results'] = {
+        logger.log_results({
             'source': source_key,
             'target': target_key,
             'dry_run': False,
             'fields_copied': len(populated_fields),
             'status': status
-        }
+        })
         
-        self._save_execution_log()
+        logger.save_to_file()
         return success, status
     
     def _execute_sync(self, target_issue, populated_fields: Dict, field_mapping: Dict, is_jpd: bool) -> bool:
@@ -1132,16 +1470,42 @@ class DateFieldCloner:
             print_info("Target issue may not have these date fields configured")
             return False
         
-        # Prepare and execute updates
+        # Prepare and execute updates: all fields in one request
         update_data = self._prepare_updates(compatible_fields, is_jpd)
-        success_count = 0
+        payload = {field_id: value for field_id, value in update_data.values()}
+        errors = self.jira_client.update_issue_fields(target_issue.key, payload)
+        
+        # A rejected request updates nothing, so retry the fields Jira did not object to one by one
+        updated = set()
+        rejected = errors.keys() & payload.keys()
+        if not errors:
+            updated.update(payload)
+        elif rejected:
+            for field_id in rejected:
+                print_error(f"Failed to update {field_id} on {target_issue.key}: {errors[field_id]}")
+            
+            # The individual PUTs are independent, so send a few at a time. Errors are
+            # printed here, not on the pool threads, so they stay with this issue's output.
+            retry = [(field_id, value) for field_id, value in payload.items() if field_id not in rejected]
+            if retry:
+                with ThreadPoolExecutor(max_workers=min(len(retry), FIELD_UPDATE_CONCURRENCY)) as pool:
+                    results = pool.map(lambda item: self.jira_client.update_issue_fields(target_issue.key, dict([item])),
+                                       retry)
+                    for (field_id, _), field_errors in zip(retry, results):
+                        if not field_errors:
+                            updated.add(field_id)
+                        for error in field_errors.values():
+                            print_error(f"Failed to update {field_id} on {target_issue.key}: {error}")
+        else:
+            print_error(f"Failed to update {target_issue.key}: {'; '.join(map(str, errors.values()))}")
         
+        success_count = 0
         for field_name, (field_id, value) in update_data.items():
-            if self.jira_client.update_issue_field(target_issue.key, field_id, value):
-                print(f"  • {field_name} ✅")
+            if field_id in updated:
+                gui_print(f"  • {field_name} ✅")
                 success_count += 1
             else:
-                print(f"  • {field_name} ❌")
+                gui_print(f"  • {field_name} ❌")
         
         # Final summary
         print_section("📊 Results")
@@ -1150,11 +1514,11 @@ class DateFieldCloner:
             if is_jpd:
                 issue_url = f"{JIRA_URL}/jira/discovery/browse/{target_issue.key}"
                 print_success(f"Updated {success_count}/{len(update_data)}")
-                print_info(f"View idea: \033]8;;{issue_url}\033\\{issue_url}\033]8;;\033\\")
+                print_info(f"View idea: {hyperlink(issue_url)}")
             else:
                 issue_url = f"{JIRA_URL}/browse/{target_issue.key}"
                 print_success(f"Updated {success_count}/{len(update_data)}")
-                print_info(f"View issue: \033]8;;{issue_url}\033\\{issue_url}\033]8;;\033\\")
+                print_info(f"View issue: {hyperlink(issue_url)}")
             
             if success_count < len(update_data):
                 print_warning("Some updates failed - check field permissions")
@@ -1222,6 +1586,9 @@ Examples:
   %(prog)s --list-fields IDEA-67890        # Show dates in IDEA-67890
   %(prog)s --list-all-fields AV-12345      # Show all fields in AV-12345
   %(prog)s --show-mapping                  # Show available milestone date fields
+
+Requests are not paused between ideas; if Jira rate limits a request it is
+retried after the Retry-After delay Jira sends back.
         '''
     )
     
@@ -1239,6 +1606,9 @@ Examples:
     parser.add_argument('--force', '-f', action='store_true', help='Skip confirmation prompts and proceed automatically')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress non-essential output')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
+    parser.add_argument('--concurrency', type=int, default=BULK_CONCURRENCY, metavar='N',
+                        help=f'Number of ideas to sync at once in bulk mode (default: {BULK_CONCURRENCY})')
+    parser.add_argument('--refresh-fields', action='store_true', help='Ignore the cached field list and fetch it from Jira')
     
     return parser.parse_args()
 
@@ -1255,9 +1625,9 @@ def get_user_inputs(args) -> Tuple[Optional[str], Optional[str]]:
     print_info("📅 This tool copies milestone dates between Jira issues and JPD ideas")
     
     if not source_key:
-        source_key = input("\n📤 Source issue (where dates will be copied FROM): ").strip()
+        source_key = prompt_input("\n📤 Source issue (where dates will be copied FROM): ").strip()
     if not target_key:
-        target_key = input("📥 Target issue (where dates will be copied TO): ").strip()
+        target_key = prompt_input("📥 Target issue (where dates will be copied TO): ").strip()
     
     if not source_key or not target_key:
         print_error("Both source and target issue keys are required")
@@ -1270,6 +1640,10 @@ def main():
     args = parse_arguments()
     
     try:
+        if args.refresh_fields:
+            clear_field_cache(JIRA_URL)
+        set_bulk_concurrency(args.concurrency)
+        
         cloner = DateFieldCloner(quiet=args.quiet, verbose=args.verbose)
         
         # Handle different modes
@@ -1316,7 +1690,7 @@ def main():
                     if args.quiet:
                         print_error("Bulk sync requires --force in quiet mode")
                         sys.exit(1)
-                    response = input("Continue? (y/N): ").strip().lower()
+                    response = prompt_input("Continue? (y/N): ").strip().lower()
                     proceed = response in ['y', 'yes']
                 
                 if proceed:
@@ -1351,6 +1725,7 @@ def main():
         print_error(f"An unexpected error occurred: {str(e)}")
         if args.verbose:
             import traceback
+            flush_output()
             traceback.print_exc()
         sys.exit(1)
 
@@ -4,9 +4,10 @@
 import compatibility_fix
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox
 import threading
 import queue
+from collections import deque
 import sys
 import os
 from datetime import datetime
@@ -14,12 +15,52 @@ import json
 
 # Import the existing JIRA functionality
 from jira_clone import (
-    DateFieldCloner, JiraClient, FieldMapper, DateFieldProcessor,
+    DateFieldCloner, ExecutionLogger, JiraClient, FieldMapper, DateFieldProcessor,
     print_header, print_section, print_success, print_warning, print_error, print_info,
     set_output_queue, set_jira_config
 )
 from config_manager import ConfigManager, CredentialsDialog
 
+def _configure_grid(frame, cols=None, rows=None):
+    """Give the listed grid columns and rows of frame a weight of 1, one Tcl call each"""
+    if cols:
+        frame.columnconfigure(cols, weight=1)
+    if rows:
+        frame.rowconfigure(rows, weight=1)
+
+class OutputQueue:
+    """Output channel from worker threads to the Tk thread (deque append/popleft are atomic, so no lock)"""
+    
+    def __init__(self, root):
+        self.root = root
+        self._messages = deque()
+        self._pending = threading.Event()
+    
+    def put(self, item, block=True, timeout=None):
+        self._messages.append(item)
+        if self._pending.is_set():
+            return  # A wake-up is already queued; one <<OutputReady>> covers the whole burst
+        self._pending.set()
+        try:
+            # Safe from worker threads: the event is queued for the main loop
+            self.root.event_generate('<<OutputReady>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass  # Window is closing; nothing left to display to
+    
+    def get_nowait(self):
+        try:
+            return self._messages.popleft()
+        except IndexError:
+            raise queue.Empty from None
+    
+    def drain(self):
+        """Remove and return every message queued so far"""
+        # Clear first: anything put from here on schedules another wake-up
+        self._pending.clear()
+        messages = self._messages
+        popleft = messages.popleft
+        return [popleft() for _ in range(len(messages))]
+
 class JiraSyncUI:
     def __init__(self, root):
         self.root = root
@@ -32,20 +73,55 @@ class JiraSyncUI:
         # Initialize configuration manager
         self.config_manager = ConfigManager()
         
-        # Initialize JIRA client
+        # Initialize JIRA client (reused across operations while the credentials stay the same)
         self.jira_cloner = None
-        self.output_queue = queue.Queue()
+        self._cloner = None
+        self._cloner_config_hash = None
+        self.output_queue = OutputQueue(self.root)
+        self.root.bind('<<OutputReady>>', self.drain_output)
+        self._max_output_lines = 5000  # Older output is dropped beyond this
+        
+        # Operations run one at a time on a single persistent worker thread
+        self.execute_buttons = []
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        
+        # Tk variables are created once here; the panels only reference them
+        self.mode_var = tk.StringVar(value="sync")
+        self.status_var = tk.StringVar(value="Ready")
+        self.dry_run_var = tk.BooleanVar(value=True)
+        self.force_var = tk.BooleanVar(value=False)
+        self.auto_force_var = tk.BooleanVar(value=False)
+        self.bulk_dry_run_var = tk.BooleanVar(value=True)
+        self.bulk_force_var = tk.BooleanVar(value=False)
+        self.list_all_fields_var = tk.BooleanVar(value=False)
+        
+        # Panel builder for each operation mode, in the order the modes are listed
+        self._mode_dispatch = {
+            "sync": self.build_sync_panel,
+            "auto": self.build_auto_panel,
+            "bulk": self.build_bulk_panel,
+            "list": self.build_list_panel,
+            "links": self.build_links_panel,
+        }
         
         # Create UI components
         self.create_widgets()
         
-        # Start output monitoring
+        # Output is shown on <<OutputReady>>; also check now and then in case one was missed
         self.monitor_output()
     
     def setup_styles(self):
         """Configure modern styling"""
-        style = ttk.Style()
-        style.theme_use('clam')
+        style = ttk.Style(self.root)
+        
+        # Styles belong to the Tk interpreter: skip if this one is already set up
+        if style.lookup('Primary.TButton', 'padding'):
+            return
+        
+        if style.theme_use() != 'clam':
+            style.theme_use('clam')
         
         # Configure colors
         style.configure('Title.TLabel', font=('SF Pro Display', 16, 'bold'))
@@ -65,16 +141,14 @@ class JiraSyncUI:
     def create_widgets(self):
         """Create the main UI layout"""
         # Configure grid weights for root
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(1, weight=1)  # Row 1 for main content
+        _configure_grid(self.root, cols=(0,), rows=(1,))  # Row 1 for main content
         
         # Main container
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Configure grid weights for main frame
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(3, weight=1)
+        _configure_grid(main_frame, cols=(1,), rows=(3,))
         
         # Title
         title_label = ttk.Label(main_frame, text="JIRA Date Sync Tool", style='Title.TLabel')
@@ -95,8 +169,9 @@ class JiraSyncUI:
         # Add configuration button to menu bar
         self.create_menu_bar()
         
-        # Check credentials after UI is fully set up
-        self.check_credentials()
+        # Check credentials once the window has been drawn, so startup isn't
+        # held up by loading the configuration or the credentials dialog
+        self.root.after_idle(self.check_credentials)
     
     def create_mode_selector(self, parent):
         """Create the mode selection tabs"""
@@ -104,9 +179,6 @@ class JiraSyncUI:
         mode_frame = ttk.LabelFrame(parent, text="Operation Mode", padding="10")
         mode_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 20))
         
-        # Mode variable
-        self.mode_var = tk.StringVar(value="sync")
-        
         # Mode buttons
         modes = [
             ("Sync Dates", "sync", "Copy dates between two issues"),
@@ -121,9 +193,10 @@ class JiraSyncUI:
                                  value=value, command=self.on_mode_change)
             btn.grid(row=0, column=i, padx=10)
             
-            # Add tooltip-like behavior
-            btn.bind('<Enter>', lambda e, t=tooltip: self.show_tooltip(e, t))
-            btn.bind('<Leave>', lambda e: self.hide_tooltip())
+            # Add tooltip-like behavior (one shared handler reads the text off the button)
+            btn.tooltip_text = tooltip
+            btn.bind('<Enter>', self.show_tooltip)
+            btn.bind('<Leave>', self.hide_tooltip)
         
         # Tooltip label
         self.tooltip_label = ttk.Label(mode_frame, text="", style='Warning.TLabel')
@@ -135,8 +208,18 @@ class JiraSyncUI:
         self.content_frame = ttk.Frame(parent)
         self.content_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 20))
         
+        # Build every mode panel once, showing only the selected one
+        self.panels = {}
+        for mode, build in self._mode_dispatch.items():
+            panel = ttk.Frame(self.content_frame)
+            build(panel)
+            panel.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            panel.grid_remove()
+            self.panels[mode] = panel
+        
         # Initialize with sync mode
-        self.show_sync_mode()
+        self._shown_panel = self.panels[self.mode_var.get()]
+        self._shown_panel.grid()
     
     def create_output_area(self, parent):
         """Create the output display area"""
@@ -145,19 +228,27 @@ class JiraSyncUI:
         output_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
         # Configure grid weights
-        output_frame.columnconfigure(0, weight=1)
-        output_frame.rowconfigure(0, weight=1)
+        _configure_grid(output_frame, cols=(0,), rows=(0,))
         
-        # Output text area
-        self.output_text = scrolledtext.ScrolledText(
+        # Output text area (read-only, no undo history to grow with every insert)
+        self.output_text = tk.Text(
             output_frame, 
             height=15, 
             font=('SF Mono', 10),
             bg='#f8f9fa',
-            fg='#212529'
+            fg='#212529',
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state='disabled'
         )
         self.output_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        output_scrollbar = ttk.Scrollbar(output_frame, orient=tk.VERTICAL,
+                                         command=self.output_text.yview)
+        output_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.output_text.configure(yscrollcommand=output_scrollbar.set)
+        
         # Clear button
         clear_btn = ttk.Button(output_frame, text="Clear Output", 
                               command=self.clear_output, style='Secondary.TButton')
@@ -165,7 +256,6 @@ class JiraSyncUI:
     
     def create_status_bar(self, parent):
         """Create the status bar"""
-        self.status_var = tk.StringVar(value="Ready")
         status_bar = ttk.Label(parent, textvariable=self.status_var, relief=tk.SUNKEN)
         status_bar.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E))
     
@@ -176,10 +266,11 @@ class JiraSyncUI:
         menu_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
         
         # Configure grid weights for menu frame
-        menu_frame.columnconfigure(1, weight=1)
+        _configure_grid(menu_frame, cols=(1,))
         
         # Status indicator (left side)
-        self.connection_status = ttk.Label(menu_frame, text="🔴 Not Connected", 
+        self._last_conn_text = "🔴 Not Connected"
+        self.connection_status = ttk.Label(menu_frame, text=self._last_conn_text, 
                                          font=('SF Pro Display', 9))
         self.connection_status.grid(row=0, column=0, sticky=tk.W)
         
@@ -207,6 +298,7 @@ class JiraSyncUI:
         
         if result:
             # New configuration saved
+            self._cloner = None
             set_jira_config(result)
             self.update_connection_status()
             messagebox.showinfo("Configuration", "JIRA configuration updated successfully!")
@@ -215,9 +307,14 @@ class JiraSyncUI:
         """Update connection status indicator"""
         config = self.config_manager.get_config()
         if config.get('email') and config.get('api_token'):
-            self.connection_status.config(text="🟢 Connected")
+            text = "🟢 Connected"
         else:
-            self.connection_status.config(text="🔴 Not Connected")
+            text = "🔴 Not Connected"
+        
+        # Only touch the label when the text changes, to avoid needless relayouts
+        if text != self._last_conn_text:
+            self.connection_status.config(text=text)
+            self._last_conn_text = text
     
     def check_credentials_before_execution(self):
         """Check if credentials are configured before executing operations"""
@@ -232,137 +329,139 @@ class JiraSyncUI:
         set_jira_config(config)
         return True
     
-    def show_tooltip(self, event, text):
-        """Show tooltip text"""
-        self.tooltip_label.config(text=text)
+    def get_cloner(self):
+        """Get the shared DateFieldCloner, building a new one when the credentials change"""
+        config = self.config_manager.get_config()
+        config_hash = hash((config.get('url'), config.get('email'), config.get('api_token')))
+        
+        if self._cloner is None or config_hash != self._cloner_config_hash:
+            self._cloner = DateFieldCloner(quiet=False, verbose=True)
+            self._cloner_config_hash = config_hash
+        else:
+            # Keep the client and field caches, but start each operation with
+            # fresh idea links and a fresh execution log
+            self._cloner.invalidate_cache()
+            self._cloner.logger = ExecutionLogger()
+        return self._cloner
+    
+    def show_tooltip(self, event):
+        """Show tooltip text for the hovered widget"""
+        self.tooltip_label.config(text=event.widget.tooltip_text)
     
-    def hide_tooltip(self):
+    def hide_tooltip(self, event=None):
         """Hide tooltip text"""
         self.tooltip_label.config(text="")
     
     def on_mode_change(self):
         """Handle mode selection change"""
-        # Clear current content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Show appropriate content
-        mode = self.mode_var.get()
-        if mode == "sync":
-            self.show_sync_mode()
-        elif mode == "auto":
-            self.show_auto_mode()
-        elif mode == "bulk":
-            self.show_bulk_mode()
-        elif mode == "list":
-            self.show_list_mode()
-        elif mode == "links":
-            self.show_links_mode()
-    
-    def show_sync_mode(self):
-        """Show sync mode interface"""
+        # Panels are built once; switching only swaps the shown panel for the selected one
+        panel = self.panels[self.mode_var.get()]
+        if panel is not self._shown_panel:
+            self._shown_panel.grid_remove()
+            panel.grid()
+            self._shown_panel = panel
+    
+    def build_sync_panel(self, panel):
+        """Build the sync panel"""
         # Source issue
-        ttk.Label(self.content_frame, text="Source Issue Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.source_entry = ttk.Entry(self.content_frame, width=30)
+        ttk.Label(panel, text="Source Issue Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.source_entry = ttk.Entry(panel, width=30)
         self.source_entry.grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
         
         # Target issue
-        ttk.Label(self.content_frame, text="Target Issue Key:", style='Header.TLabel').grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.target_entry = ttk.Entry(self.content_frame, width=30)
+        ttk.Label(panel, text="Target Issue Key:", style='Header.TLabel').grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.target_entry = ttk.Entry(panel, width=30)
         self.target_entry.grid(row=1, column=1, padx=(10, 0), pady=5, sticky=tk.W)
         
         # Options frame
-        options_frame = ttk.LabelFrame(self.content_frame, text="Options", padding="10")
+        options_frame = ttk.LabelFrame(panel, text="Options", padding="10")
         options_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=20)
         
-        self.dry_run_var = tk.BooleanVar(value=True)
-        self.force_var = tk.BooleanVar(value=False)
-        
         ttk.Checkbutton(options_frame, text="Dry Run (Preview Only)", 
                        variable=self.dry_run_var).grid(row=0, column=0, sticky=tk.W)
         ttk.Checkbutton(options_frame, text="Force (Skip Confirmation)", 
                        variable=self.force_var).grid(row=0, column=1, sticky=tk.W, padx=(20, 0))
         
         # Execute button
-        execute_btn = ttk.Button(self.content_frame, text="Sync Dates", 
+        execute_btn = ttk.Button(panel, text="Sync Dates", 
                                 command=self.execute_sync, style='Primary.TButton')
         execute_btn.grid(row=3, column=0, columnspan=2, pady=20)
+        self.execute_buttons.append(execute_btn)
     
-    def show_auto_mode(self):
-        """Show auto sync mode interface"""
-        ttk.Label(self.content_frame, text="JPD Idea Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.auto_jpd_entry = ttk.Entry(self.content_frame, width=30)
+    def build_auto_panel(self, panel):
+        """Build the auto sync panel"""
+        ttk.Label(panel, text="JPD Idea Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.auto_jpd_entry = ttk.Entry(panel, width=30)
         self.auto_jpd_entry.grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
         
         # Options
-        options_frame = ttk.LabelFrame(self.content_frame, text="Options", padding="10")
+        options_frame = ttk.LabelFrame(panel, text="Options", padding="10")
         options_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=20)
         
-        self.auto_force_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(options_frame, text="Force (Skip Confirmation)", 
                        variable=self.auto_force_var).grid(row=0, column=0, sticky=tk.W)
         
         # Execute button
-        execute_btn = ttk.Button(self.content_frame, text="Auto Sync", 
+        execute_btn = ttk.Button(panel, text="Auto Sync", 
                                 command=self.execute_auto_sync, style='Primary.TButton')
         execute_btn.grid(row=2, column=0, columnspan=2, pady=20)
+        self.execute_buttons.append(execute_btn)
     
-    def show_bulk_mode(self):
-        """Show bulk sync mode interface"""
-        ttk.Label(self.content_frame, text="Project Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.bulk_project_entry = ttk.Entry(self.content_frame, width=30)
+    def build_bulk_panel(self, panel):
+        """Build the bulk sync panel"""
+        ttk.Label(panel, text="Project Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.bulk_project_entry = ttk.Entry(panel, width=30)
         self.bulk_project_entry.grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
         
         # Options
-        options_frame = ttk.LabelFrame(self.content_frame, text="Options", padding="10")
+        options_frame = ttk.LabelFrame(panel, text="Options", padding="10")
         options_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=20)
         
-        self.bulk_dry_run_var = tk.BooleanVar(value=True)
-        self.bulk_force_var = tk.BooleanVar(value=False)
-        
         ttk.Checkbutton(options_frame, text="Dry Run (Preview Only)", 
                        variable=self.bulk_dry_run_var).grid(row=0, column=0, sticky=tk.W)
         ttk.Checkbutton(options_frame, text="Force (Skip Confirmation)", 
                        variable=self.bulk_force_var).grid(row=0, column=1, sticky=tk.W, padx=(20, 0))
         
         # Execute button
-        execute_btn = ttk.Button(self.content_frame, text="Bulk Sync", 
+        execute_btn = ttk.Button(panel, text="Bulk Sync", 
                                 command=self.execute_bulk_sync, style='Primary.TButton')
         execute_btn.grid(row=2, column=0, columnspan=2, pady=20)
+        self.execute_buttons.append(execute_btn)
     
-    def show_list_mode(self):
-        """Show list fields mode interface"""
-        ttk.Label(self.content_frame, text="Issue Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.list_issue_entry = ttk.Entry(self.content_frame, width=30)
+    def build_list_panel(self, panel):
+        """Build the list fields panel"""
+        ttk.Label(panel, text="Issue Key:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.list_issue_entry = ttk.Entry(panel, width=30)
         self.list_issue_entry.grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
         
         # Options
-        options_frame = ttk.LabelFrame(self.content_frame, text="Options", padding="10")
+        options_frame = ttk.LabelFrame(panel, text="Options", padding="10")
         options_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=20)
         
-        self.list_all_fields_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(options_frame, text="Show All Fields (Including Empty)", 
                        variable=self.list_all_fields_var).grid(row=0, column=0, sticky=tk.W)
         
         # Execute button
-        execute_btn = ttk.Button(self.content_frame, text="List Fields", 
+        execute_btn = ttk.Button(panel, text="List Fields", 
                                 command=self.execute_list_fields, style='Primary.TButton')
         execute_btn.grid(row=2, column=0, columnspan=2, pady=20)
+        self.execute_buttons.append(execute_btn)
     
-    def show_links_mode(self):
-        """Show check links mode interface"""
-        ttk.Label(self.content_frame, text="Source Issue:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.links_source_entry = ttk.Entry(self.content_frame, width=30)
+    def build_links_panel(self, panel):
+        """Build the check links panel"""
+        ttk.Label(panel, text="Source Issue:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.links_source_entry = ttk.Entry(panel, width=30)
         self.links_source_entry.grid(row=0, column=1, padx=(10, 0), pady=5, sticky=tk.W)
         
-        ttk.Label(self.content_frame, text="Target Issue:", style='Header.TLabel').grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.links_target_entry = ttk.Entry(self.content_frame, width=30)
+        ttk.Label(panel, text="Target Issue:", style='Header.TLabel').grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.links_target_entry = ttk.Entry(panel, width=30)
         self.links_target_entry.grid(row=1, column=1, padx=(10, 0), pady=5, sticky=tk.W)
         
         # Execute button
-        execute_btn = ttk.Button(self.content_frame, text="Check Links", 
+        execute_btn = ttk.Button(panel, text="Check Links", 
                                 command=self.execute_check_links, style='Primary.TButton')
         execute_btn.grid(row=2, column=0, columnspan=2, pady=20)
+        self.execute_buttons.append(execute_btn)
     
     def execute_sync(self):
         """Execute sync operation"""
@@ -377,31 +476,14 @@ class JiraSyncUI:
             messagebox.showerror("Error", "Please enter both source and target issue keys")
             return
         
+        params = {'dry_run': self.dry_run_var.get(), 'force': self.force_var.get()}
+        
         self.status_var.set("Executing sync...")
         self.clear_output()
         
-        def run_sync():
-            try:
-                # Set output queue for GUI integration
-                set_output_queue(self.output_queue)
-                
-                self.jira_cloner = DateFieldCloner(quiet=False, verbose=True)
-                success = self.jira_cloner.clone_fields(
-                    source, target, 
-                    dry_run=self.dry_run_var.get(), 
-                    force=self.force_var.get()
-                )
-                
-                if success:
-                    self.status_var.set("Sync completed successfully")
-                else:
-                    self.status_var.set("Sync failed")
-                    
-            except Exception as e:
-                self.output_queue.put(f"Error: {str(e)}")
-                self.status_var.set("Sync failed with error")
-        
-        threading.Thread(target=run_sync, daemon=True).start()
+        self.submit_job(lambda: self._run_job(
+            lambda cloner: cloner.clone_fields(source, target, **params),
+            "Sync completed successfully", "Sync failed", "Sync failed with error"))
     
     def execute_auto_sync(self):
         """Execute auto sync operation"""
@@ -415,29 +497,14 @@ class JiraSyncUI:
             messagebox.showerror("Error", "Please enter a JPD idea key")
             return
         
+        params = {'force': self.auto_force_var.get()}
+        
         self.status_var.set("Executing auto sync...")
         self.clear_output()
         
-        def run_auto_sync():
-            try:
-                # Set output queue for GUI integration
-                set_output_queue(self.output_queue)
-                
-                self.jira_cloner = DateFieldCloner(quiet=False, verbose=True)
-                success = self.jira_cloner.auto_sync_from_jpd(
-                    jpd_key, force=self.auto_force_var.get()
-                )
-                
-                if success:
-                    self.status_var.set("Auto sync completed successfully")
-                else:
-                    self.status_var.set("Auto sync failed")
-                    
-            except Exception as e:
-                self.output_queue.put(f"Error: {str(e)}")
-                self.status_var.set("Auto sync failed with error")
-        
-        threading.Thread(target=run_auto_sync, daemon=True).start()
+        self.submit_job(lambda: self._run_job(
+            lambda cloner: cloner.auto_sync_from_jpd(jpd_key, **params),
+            "Auto sync completed successfully", "Auto sync failed", "Auto sync failed with error"))
     
     def execute_bulk_sync(self):
         """Execute bulk sync operation"""
@@ -451,31 +518,20 @@ class JiraSyncUI:
             messagebox.showerror("Error", "Please enter a project key")
             return
         
+        params = {'dry_run': self.bulk_dry_run_var.get(), 'force': self.bulk_force_var.get()}
+        
+        # Confirm the whole run once; ideas are not confirmed individually
+        if not params['dry_run'] and not params['force']:
+            if not messagebox.askyesno("Confirm Bulk Sync",
+                                       f"This will update dates on all ideas in {project}. Continue?"):
+                return
+        
         self.status_var.set("Executing bulk sync...")
         self.clear_output()
         
-        def run_bulk_sync():
-            try:
-                # Set output queue for GUI integration
-                set_output_queue(self.output_queue)
-                
-                self.jira_cloner = DateFieldCloner(quiet=False, verbose=True)
-                success = self.jira_cloner.bulk_sync_project(
-                    project, 
-                    dry_run=self.bulk_dry_run_var.get(), 
-                    force=self.bulk_force_var.get()
-                )
-                
-                if success:
-                    self.status_var.set("Bulk sync completed successfully")
-                else:
-                    self.status_var.set("Bulk sync failed")
-                    
-            except Exception as e:
-                self.output_queue.put(f"Error: {str(e)}")
-                self.status_var.set("Bulk sync failed with error")
-        
-        threading.Thread(target=run_bulk_sync, daemon=True).start()
+        self.submit_job(lambda: self._run_job(
+            lambda cloner: cloner.bulk_sync_project(project, **params),
+            "Bulk sync completed successfully", "Bulk sync failed", "Bulk sync failed with error"))
     
     def execute_list_fields(self):
         """Execute list fields operation"""
@@ -489,29 +545,14 @@ class JiraSyncUI:
             messagebox.showerror("Error", "Please enter an issue key")
             return
         
+        params = {'show_empty': self.list_all_fields_var.get()}
+        
         self.status_var.set("Listing fields...")
         self.clear_output()
         
-        def run_list_fields():
-            try:
-                # Set output queue for GUI integration
-                set_output_queue(self.output_queue)
-                
-                self.jira_cloner = DateFieldCloner(quiet=False, verbose=True)
-                success = self.jira_cloner.field_lister.list_fields(
-                    issue_key, show_empty=self.list_all_fields_var.get()
-                )
-                
-                if success:
-                    self.status_var.set("Fields listed successfully")
-                else:
-                    self.status_var.set("Failed to list fields")
-                    
-            except Exception as e:
-                self.output_queue.put(f"Error: {str(e)}")
-                self.status_var.set("Failed to list fields")
-        
-        threading.Thread(target=run_list_fields, daemon=True).start()
+        self.submit_job(lambda: self._run_job(
+            lambda cloner: cloner.field_lister.list_fields(issue_key, **params),
+            "Fields listed successfully", "Failed to list fields", "Failed to list fields"))
     
     def execute_check_links(self):
         """Execute check links operation"""
@@ -529,56 +570,87 @@ class JiraSyncUI:
         self.status_var.set("Checking links...")
         self.clear_output()
         
-        def run_check_links():
+        self.submit_job(lambda: self._run_job(
+            lambda cloner: cloner.check_links(source, target),
+            "Links found", "No links found", "Failed to check links"))
+    
+    def _run_job(self, operation, success_status, failure_status, error_status):
+        """Run operation(cloner) on the worker thread and report its outcome in the status bar"""
+        try:
+            # Set output queue for GUI integration
+            set_output_queue(self.output_queue)
+            
+            self.jira_cloner = self.get_cloner()
+            status = success_status if operation(self.jira_cloner) else failure_status
+        except Exception as e:
+            self.output_queue.put(f"Error: {e}")
+            status = error_status
+        
+        # Tk variables are only touched from the main loop
+        self.root.after(0, self.status_var.set, status)
+    
+    def submit_job(self, job):
+        """Queue an operation for the worker thread, disabling the execute buttons until it finishes"""
+        # Jobs must not read Tk widgets or variables: callers snapshot their inputs before submitting
+        for button in self.execute_buttons:
+            button.state(['disabled'])
+        self._jobs.put(job)
+    
+    def _worker_loop(self):
+        """Run queued operations one after another"""
+        while True:
+            job = self._jobs.get()
             try:
-                # Set output queue for GUI integration
-                set_output_queue(self.output_queue)
-                
-                self.jira_cloner = DateFieldCloner(quiet=False, verbose=True)
-                success = self.jira_cloner.check_links(source, target)
-                
-                if success:
-                    self.status_var.set("Links found")
-                else:
-                    self.status_var.set("No links found")
-                    
-            except Exception as e:
-                self.output_queue.put(f"Error: {str(e)}")
-                self.status_var.set("Failed to check links")
-        
-        threading.Thread(target=run_check_links, daemon=True).start()
+                job()
+            finally:
+                self.root.after(0, self._enable_execute_buttons)
+    
+    def _enable_execute_buttons(self):
+        """Re-enable the execute buttons once no operation is waiting"""
+        if self._jobs.empty():
+            for button in self.execute_buttons:
+                button.state(['!disabled'])
     
     def clear_output(self):
         """Clear the output text area"""
+        self.output_text.configure(state='normal')
         self.output_text.delete(1.0, tk.END)
+        self.output_text.configure(state='disabled')
+    
+    def trim_output(self):
+        """Drop the oldest lines so the output area holds at most _max_output_lines"""
+        # Checked once per drained batch, not per line; the widget must be editable
+        lines = int(self.output_text.index('end-1c').split('.')[0])
+        excess = lines - self._max_output_lines
+        if excess > 0:
+            self.output_text.delete('1.0', f'{excess + 1}.0')
+    
+    def drain_output(self, event=None):
+        """Show everything queued so far with a single insert"""
+        chunks = [f"{message}\n" for message in self.output_queue.drain()]
+        
+        if chunks:
+            self.output_text.configure(state='normal')
+            self.output_text.insert(tk.END, "".join(chunks))
+            self.trim_output()
+            self.output_text.configure(state='disabled')
+            self.output_text.see(tk.END)
     
     def monitor_output(self):
-        """Monitor output queue and update display"""
-        try:
-            while True:
-                # Check for output from the queue
-                try:
-                    output = self.output_queue.get_nowait()
-                    self.output_text.insert(tk.END, output + "\n")
-                    self.output_text.see(tk.END)
-                except queue.Empty:
-                    break
-        except:
-            pass
-        
-        # Schedule next check
-        self.root.after(100, self.monitor_output)
+        """Safety net for output whose <<OutputReady>> event was missed"""
+        self.drain_output()
+        self.root.after(500, self.monitor_output)
 
 def main():
     """Main application entry point"""
     root = tk.Tk()
     app = JiraSyncUI(root)
     
-    # Center the window
-    root.update_idletasks()
-    x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-    y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
-    root.geometry(f"+{x}+{y}")
+    # Center the window (size is the one set in JiraSyncUI, so no layout pass is needed)
+    w, h = 900, 700
+    x = (root.winfo_screenwidth() - w) // 2
+    y = (root.winfo_screenheight() - h) // 2
+    root.geometry(f"{w}x{h}+{x}+{y}")
     
     # Start the application
     root.mainloop()
@@ -11,7 +11,7 @@ print("Testing compatibility fix...")
 # Import the compatibility fix
 import compatibility_fix
 
-# Try to import JIRA
+# Try to import JIRA (this pulls in imghdr, which the fix provides on Python 3.13+)
 try:
     from jira import JIRA
     print("✅ JIRA import successful!")
@@ -19,12 +19,4 @@ except Exception as e:
     print(f"❌ JIRA import failed: {e}")
     sys.exit(1)
 
-# Try to create a JIRA client (without connecting)
-try:
-    # This should not actually connect, just test the import
-    print("✅ JIRA client creation test passed!")
-except Exception as e:
-    print(f"❌ JIRA client creation failed: {e}")
-    sys.exit(1)
-
 print("✅ All compatibility tests passed!") 
\ No newline at end of file
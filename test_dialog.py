@@ -8,16 +8,13 @@ import tkinter as tk
 from tkinter import ttk
 from config_manager import CredentialsDialog, ConfigManager
 
-def test_dialog():
+def test_dialog(tk_root):
     """Test the configuration dialog"""
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    
     # Create config manager
     config_manager = ConfigManager()
     
     # Create and show dialog
-    dialog = CredentialsDialog(root, config_manager)
+    dialog = CredentialsDialog(tk_root, config_manager)
     result = dialog.show()
     
     if result:
@@ -27,8 +24,9 @@ def test_dialog():
         print(f"API Token: {'*' * len(result['api_token'])}")
     else:
         print("Configuration cancelled")
-    
-    root.destroy()
 
 if __name__ == "__main__":
-    test_dialog() 
\ No newline at end of file
+    root = tk.Tk()
+    root.withdraw()  # Hide the main window
+    test_dialog(root)
+    root.destroy() 
\ No newline at end of file